@@ -8,6 +8,7 @@ geocodes, and outputs to conferences.json grouped by month.
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -15,31 +16,53 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from sources import developers_events, tech_conferences, dblp, papercall
-from sources import ieee, acm, ml_conferences
-# Note: wikicfp requires beautifulsoup4, included optionally
-try:
-    from sources import wikicfp
-    HAS_WIKICFP = True
-except ImportError:
-    HAS_WIKICFP = False
+from sources import ieee, acm, ml_conferences, wikicfp
 
 from utils.deduplication import deduplicate
-from utils.domain_classifier import classify, extract_tags
+from utils.dedup_index import DedupIndex
+from utils.classification_cache import ClassificationCache
 from utils.geocoder import geocode
 from utils.discord_notifier import send_new_cfps, send_closing_soon
+from utils.fetch_runner import run_sources, format_summary
+from utils.http_fixtures import is_replaying
+from utils.paths import CACHE_DIR
 
 
-OUTPUT_PATH = Path(__file__).parent.parent / "public" / "data" / "conferences.json"
+OUTPUT_PATH = Path(os.environ.get(
+    "CONFSCOUT_OUTPUT_PATH",
+    Path(__file__).parent.parent / "public" / "data" / "conferences.json",
+))
 PREVIOUS_DATA_PATH = OUTPUT_PATH
 
+# Per-source wall-clock budgets (seconds); others use the runner default.
+# WikiCFP pages through dozens of categories, so it gets the largest share
+# of the 15-minute workflow budget.
+SOURCE_DEADLINES = {
+    "WikiCFP": 480,
+    "Tech Conferences": 180,
+    "DBLP": 180,
+}
+
+# Clustering state carried between runs; re-clustered from scratch weekly
+DEDUP_INDEX_PATH = CACHE_DIR / "dedup_index.json"
+DEDUP_REBUILD_DAYS = 7
+
+# Classification results by name, dropped when the keyword tables change
+CLASSIFICATION_CACHE_PATH = CACHE_DIR / "classification_cache.json"
+
 
 def main():
     print("=" * 60)
     print("ConfScout Conference Aggregator")
     print("=" * 60)
+    if is_replaying():
+        print("Replaying recorded HTTP fixtures (no network)")
+    
+    clock = _StageClock()
     
     # 1. Fetch from all sources
     print("\n[1/6] Fetching from sources...")
+    clock.start("fetch")
     all_conferences = []
     
     sources = [
@@ -52,29 +75,43 @@ def main():
         ("IEEE", ieee.fetch),
         ("ACM", acm.fetch),
         ("ML Conferences", ml_conferences.fetch),
+        # Scraped sources
+        ("WikiCFP", wikicfp.fetch),
     ]
     
-    # Add WikiCFP if beautifulsoup4 is available
-    if HAS_WIKICFP:
-        sources.append(("WikiCFP", wikicfp.fetch))
+    # Run all sources at the same time, each under its own deadline
+    source_results = run_sources([
+        (name, fetch_fn, SOURCE_DEADLINES[name]) if name in SOURCE_DEADLINES else (name, fetch_fn)
+        for name, fetch_fn in sources
+    ])
     
-    for name, fetch_fn in sources:
-        try:
-            confs = fetch_fn()
-            all_conferences.extend(confs)
-            print(f"  ✓ {name}: {len(confs)} conferences")
-        except Exception as e:
-            print(f"  ✗ {name}: Error - {e}")
+    for result in source_results:
+        all_conferences.extend(result.conferences)
+        if result.status == "ok":
+            print(f"  ✓ {result.name}: {len(result.conferences)} conferences")
+        elif result.status == "partial":
+            print(f"  ~ {result.name}: {len(result.conferences)} conferences (deadline reached, partial)")
+        elif result.status == "timeout":
+            print(f"  ✗ {result.name}: Timed out after {result.elapsed:.0f}s")
+        else:
+            print(f"  ✗ {result.name}: Error - {result.error}")
     
     print(f"\nTotal raw conferences: {len(all_conferences)}")
     
     # 2. Deduplicate
     print("\n[2/7] Deduplicating...")
-    conferences = deduplicate(all_conferences)
+    clock.start("deduplicate")
+    dedup_index = DedupIndex(DEDUP_INDEX_PATH, DEDUP_REBUILD_DAYS).load()
+    conferences = deduplicate(all_conferences, dedup_index)
     print(f"After deduplication: {len(conferences)}")
+    try:
+        dedup_index.save()
+    except OSError as e:
+        print(f"  Could not save dedup index: {e}")
     
     # 2.5 Filter out past conferences
     print("\n[3/7] Filtering past conferences...")
+    clock.start("filter")
     today = datetime.now().strftime("%Y-%m-%d")
     
     def is_future_or_undated(conf):
@@ -94,14 +131,20 @@ def main():
     
     # 3. Classify and enrich
     print("\n[4/7] Classifying and enriching...")
-    for conf in conferences:
-        # Domain classification
-        domain, sub_domains = classify(conf.get("name", ""))
+    clock.start("enrich")
+    # Domain classification and tags, reusing results for names seen before
+    classification_cache = ClassificationCache(CLASSIFICATION_CACHE_PATH).load()
+    enrichment = classification_cache.enrich_many([conf.get("name", "") for conf in conferences])
+    print(f"  Classified {classification_cache.misses} new names ({classification_cache.hits} cached)")
+    try:
+        classification_cache.save()
+    except OSError as e:
+        print(f"  Could not save classification cache: {e}")
+    
+    for conf, (domain, sub_domains, conf_tags) in zip(conferences, enrichment):
         conf["domain"] = domain
         conf["subDomains"] = sub_domains
-        
-        # Extract tags
-        conf["tags"] = extract_tags(conf.get("name", ""))
+        conf["tags"] = conf_tags
         
         # Geocode location
         loc = conf.get("location", {})
@@ -122,10 +165,12 @@ def main():
     
     # 5. Group by month
     print("\n[5/7] Grouping by month...")
+    clock.start("group")
     grouped = _group_by_month(conferences)
     
     # 6. Calculate stats
     print("\n[6/7] Calculating stats...")
+    clock.start("stats")
     stats = {
         "total": len(conferences),
         "withOpenCFP": sum(1 for c in conferences if (c.get("cfp") or {}).get("status") == "open"),
@@ -135,6 +180,7 @@ def main():
     
     # 7. Output
     print("\n[7/7] Writing output...")
+    clock.start("write")
     output = {
         "lastUpdated": datetime.utcnow().isoformat() + "Z",
         "stats": stats,
@@ -144,14 +190,21 @@ def main():
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(OUTPUT_PATH, "w") as f:
         json.dump(output, f, indent=2, default=str)
+    clock.stop()
     
     print(f"\n✓ Written to {OUTPUT_PATH}")
     print(f"  Total conferences: {stats['total']}")
     print(f"  With open CFP: {stats['withOpenCFP']}")
     print(f"  With location: {stats['withLocation']}")
+    print("\n  Source latency:")
+    for line in format_summary(source_results):
+        print(line)
+    print("\n  Stage timings:")
+    for line in clock.summary():
+        print(line)
     
     # 7. Discord notifications (if enabled)
-    if os.environ.get("DISCORD_WEBHOOK_URL"):
+    if os.environ.get("DISCORD_WEBHOOK_URL") and not is_replaying():
         print("\n[Extra] Sending Discord notifications...")
         _send_notifications(conferences)
     
@@ -159,6 +212,32 @@ def main():
     print("Done!")
 
 
+class _StageClock:
+    """Wall-clock time per pipeline stage, for comparing runs."""
+    
+    def __init__(self):
+        self.times: dict[str, float] = {}
+        self._name = None
+        self._started = 0.0
+    
+    def start(self, name: str):
+        """Close the running stage (if any) and start timing `name`."""
+        self.stop()
+        self._name = name
+        self._started = time.perf_counter()
+    
+    def stop(self):
+        if self._name:
+            self.times[self._name] = time.perf_counter() - self._started
+            self._name = None
+    
+    def summary(self) -> list[str]:
+        total = sum(self.times.values())
+        lines = [f"  {name:<12} {secs:8.3f}s" for name, secs in self.times.items()]
+        lines.append(f"  {'total':<12} {total:8.3f}s")
+        return lines
+
+
 def _days_remaining(date_str: str):
     """Calculate days remaining until a date."""
     if not date_str:
@@ -0,0 +1,151 @@
+"""
+Classifier Benchmark
+
+Times the keyword classifiers on every conference in conferences.json and
+checks that they give exactly the answers of the per-keyword substring
+scans they replaced (set CONFSCOUT_KEYWORD_ENGINE=python to time the
+pure-Python automaton when pyahocorasick is installed):
+
+- utils.domain_classifier.classify
+- fetch_confs.classify_domain
+- domain_classifier.extract_tags and fetch_confs.extract_tags
+- domain_classifier.classify_many / extract_tags_many, the batch versions
+  used by aggregate_data, on the dataset's names repeated (and numbered)
+  up to --batch records
+
+Usage:
+    python scripts/benchmarks/bench_classifier.py [--data PATH] [--repeat N] [--batch N]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fetch_confs
+from utils import domain_classifier
+from utils.keyword_automaton import DEFAULT_ENGINE
+
+
+DEFAULT_DATA_PATH = Path(__file__).parent.parent.parent / "public" / "data" / "conferences.json"
+
+
+def scan_classify(name: str, tags: list[str] = None) -> tuple[str, list[str]]:
+    """The previous domain_classifier.classify, as a reference."""
+    text = (name + " " + " ".join(tags or [])).lower()
+    matches = []
+    for domain, keywords in domain_classifier.DOMAIN_KEYWORDS.items():
+        score = sum(1 for kw in keywords if kw in text)
+        if score > 0:
+            matches.append((domain, score))
+    if not matches:
+        return "general", []
+    matches.sort(key=lambda x: x[1], reverse=True)
+    return matches[0][0], [m[0] for m in matches[1:4]]
+
+
+def scan_classify_domain(name: str, description: str = "") -> str:
+    """The previous fetch_confs.classify_domain, as a reference."""
+    text = f"{name} {description}".lower()
+    domain_scores = {}
+    for domain, keywords in fetch_confs.DOMAIN_KEYWORDS.items():
+        score = sum(1 for keyword in keywords if keyword in text)
+        if score > 0:
+            domain_scores[domain] = score
+    if domain_scores:
+        return max(domain_scores, key=domain_scores.get)
+    return "general"
+
+
+def scan_extract_tags(name: str, description: str = "") -> list[str]:
+    """The previous domain_classifier.extract_tags, as a reference."""
+    text = f"{name} {description}".lower()
+    return [tag for tag in domain_classifier.TECH_TAGS if re.search(rf"\b{re.escape(tag)}\b", text)][:5]
+
+
+def scan_fetch_extract_tags(name: str, description: str = "") -> list[str]:
+    """The previous fetch_confs.extract_tags, as a reference."""
+    text = f"{name} {description}".lower()
+    return [tag for tag, keywords in fetch_confs.TAG_KEYWORDS.items() if any(k in text for k in keywords)]
+
+
+def load_records(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [conf for month in json.load(f)["months"].values() for conf in month]
+
+
+def time_calls(func, args: list[tuple], repeat: int) -> tuple[float, list]:
+    """Best time over `repeat` runs of func(*a) for every a, and the results."""
+    best = float("inf")
+    for _ in range(repeat):
+        # Time the classifiers, not their in-process memo
+        domain_classifier._classify_text.cache_clear()
+        domain_classifier._extract_tags_text.cache_clear()
+        start = time.perf_counter()
+        results = [func(*a) for a in args]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", type=Path, default=DEFAULT_DATA_PATH)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=100_000, help="Records in the batch API run")
+    args = parser.parse_args()
+
+    records = load_records(args.data)
+    print(f"{len(records)} conferences from {args.data.name}, keyword engine: {DEFAULT_ENGINE}\n")
+
+    cases = [
+        ("classify", domain_classifier.classify, scan_classify,
+         [(c.get("name", ""), c.get("tags")) for c in records]),
+        ("classify_domain", fetch_confs.classify_domain, scan_classify_domain,
+         [(c.get("name", ""), c.get("description") or "") for c in records]),
+        ("extract_tags", domain_classifier.extract_tags, scan_extract_tags,
+         [(c.get("name", ""), c.get("description") or "") for c in records]),
+        ("fetch extract_tags", fetch_confs.extract_tags, scan_fetch_extract_tags,
+         [(c.get("name", ""), c.get("description") or "") for c in records]),
+    ]
+
+    failed = False
+    for label, func, reference, calls in cases:
+        new_time, new_results = time_calls(func, calls, args.repeat)
+        old_time, old_results = time_calls(reference, calls, args.repeat)
+        mismatches = sum(1 for a, b in zip(new_results, old_results) if a != b)
+        failed |= mismatches > 0
+        per_record = lambda seconds: seconds / len(calls) * 1e6
+        print(
+            f"  {label:<22} old {per_record(old_time):7.2f} us/rec  "
+            f"new {per_record(new_time):7.2f} us/rec  "
+            f"x{old_time / new_time if new_time else float('inf'):.1f}  mismatches={mismatches}"
+        )
+
+    # Distinct names, so the in-process memo doesn't answer repeats
+    names = [f"{records[i % len(records)].get('name', '')} {i}" for i in range(args.batch)]
+    print(f"\n  Batch of {len(names):,d} names:")
+    batch_cases = [
+        ("classify_many",
+         [("batch", lambda: domain_classifier.classify_many(names))],
+         lambda: [domain_classifier.classify(n) for n in names]),
+        ("extract_tags_many", [("regex", lambda: domain_classifier.extract_tags_many(names))],
+         lambda: [domain_classifier.extract_tags(n) for n in names]),
+    ]
+    for label, engines, loop in batch_cases:
+        loop_time, loop_results = time_calls(loop, [()], args.repeat)
+        print(f"  {label:<22} loop {loop_time * 1000:8.1f} ms")
+        for engine, batch in engines:
+            batch_time, batch_results = time_calls(batch, [()], args.repeat)
+            mismatches = sum(1 for a, b in zip(batch_results[0], loop_results[0]) if a != b)
+            failed |= mismatches > 0
+            print(f"  {'':<22} {engine:<6} {batch_time * 1000:8.1f} ms  x{loop_time / batch_time:.1f}  mismatches={mismatches}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
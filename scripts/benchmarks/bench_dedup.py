@@ -0,0 +1,271 @@
+"""
+Deduplication Benchmark
+
+Measures utils.deduplication for speed and for quality:
+
+- Synthetic datasets of a given size, where every record carries the id of
+  the event it was generated from. Name variants mimic what the sources
+  actually disagree on: case, punctuation, a trailing year, "Conf" vs
+  "Conference", a leading "The", accented letters.
+- A hand-labeled gold set built from real conferences.json records
+  (data/dedup_gold.json), including look-alike events that must stay apart.
+
+Each run reports throughput, peak traced memory, and pairwise precision
+and recall against the known clusters. Synthetic runs also time the
+n-gram blocking step alone, since it is the part that grows fastest.
+
+Usage:
+    python scripts/benchmarks/bench_dedup.py [--sizes 1k,10k,100k,1M] [--seed N] [--no-memory] [--verbose]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.deduplication import SOURCE_PRIORITY, MatchFeatures, find_clusters
+from utils.ngram_index import candidate_pairs
+
+
+GOLD_PATH = Path(__file__).parent / "data" / "dedup_gold.json"
+
+DEFAULT_SIZES = "1k,10k,100k"
+
+CITIES = [
+    "Amsterdam", "Berlin", "Lisbon", "Zürich", "Montréal", "Kraków", "São Paulo", "Málaga",
+    "London", "Paris", "Tokyo", "Austin", "Chicago", "Toronto", "Bengaluru", "Sydney",
+    "Oslo", "Milano", "Torino", "Lyon", "Lille", "Nantes", "Porto", "Dublin", "Prague",
+    "Vienna", "Warsaw", "Athens", "Istanbul", "Singapore", "Seoul", "Denver", "Seattle",
+]
+TOPICS = [
+    "Cloud Native", "DevOps", "Kubernetes", "Rust", "Python", "JavaScript", "React", "Kotlin",
+    "Java", "Data", "Machine Learning", "AI", "Security", "Web", "Mobile", "Android", "PHP",
+    "Go", "Serverless", "Platform Engineering", "SRE", "Testing", "Frontend", "API", "GraphQL",
+    "Observability", "Database", "Blockchain", "Quantum", "Embedded", "Game Dev", "UX",
+]
+KINDS = ["Conference", "Summit", "Days", "Camp", "Con", "Forum", "Meetup", "Festival", "Symposium"]
+CONSONANTS = "bcdfghjklmnprstvwxz"
+VOWELS = "aeiouy"
+
+ACCENTS = str.maketrans({"e": "é", "a": "á", "o": "ö", "u": "ü", "i": "í", "c": "ç"})
+
+
+def parse_size(value: str) -> int:
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1], 1)
+    return int(float(value.rstrip("km")) * multiplier)
+
+
+def _variant(name: str, rng: random.Random) -> str:
+    """One of the ways two sources spell the same event differently."""
+    kind = rng.randrange(8)
+    if kind == 0:
+        return name.upper() if rng.random() < 0.5 else name.lower()
+    if kind == 1:
+        return name + rng.choice(["!", "?", " -", "."])
+    if kind == 2:
+        return name + " 2026" if not name.endswith("2026") else name[:-5]
+    if kind == 3:
+        return name.replace("Conference", "Conf") if "Conference" in name else name.replace("Con", "Conference")
+    if kind == 4:
+        return "The " + name
+    if kind == 5:
+        # Accent one word only
+        words = name.split()
+        i = rng.randrange(len(words))
+        words[i] = words[i].translate(ACCENTS)
+        return " ".join(words)
+    if kind == 6:
+        return name.replace(" ", " - ", 1)
+    return name.replace(" ", "", 1)
+
+
+def generate(size: int, seed: int = 0) -> tuple[list[dict], list[int]]:
+    """
+    Synthetic records and, for each one, the id of its true event.
+
+    Look-alike events exist on purpose: series brands reused in another
+    city, generic "<Topic> <Kind> <City>" names, and the same name in
+    different months. About 40% of events are reported by more than one
+    source.
+    """
+    rng = random.Random(seed)
+    sources = list(SOURCE_PRIORITY)
+    start = date(2026, 1, 1)
+    seen_names = set()
+    brands: list[str] = []
+    records, labels = [], []
+    event_id = 0
+
+    while len(records) < size:
+        if brands and rng.random() < 0.1:
+            # Another event of an existing series, somewhere else
+            brand = rng.choice(brands)
+        else:
+            brand = "".join(
+                rng.choice(CONSONANTS) + rng.choice(VOWELS) + rng.choice(("", "", *CONSONANTS))
+                for _ in range(rng.randint(2, 3))
+            ).capitalize()
+            brands.append(brand)
+        pattern = rng.random()
+        if pattern < 0.2:
+            name = brand
+        elif pattern < 0.45:
+            name = f"{brand} {rng.choice(KINDS)}"
+        elif pattern < 0.7:
+            name = f"{brand} {rng.choice(TOPICS)} {rng.choice(KINDS)}"
+        elif pattern < 0.8:
+            # Generic names are the worst case for blocking: every one of
+            # their n-grams is common
+            name = f"{rng.choice(TOPICS)} {rng.choice(KINDS)} {rng.choice(CITIES)}"
+        else:
+            name = f"{brand} {rng.choice(CITIES)}"
+        day = start + timedelta(days=rng.randrange(365))
+        if (name, day.month) in seen_names:
+            continue
+        seen_names.add((name, day.month))
+
+        copies = 1 + (rng.random() < 0.4) + (rng.random() < 0.15)
+        for copy in range(min(copies, size - len(records))):
+            record_day = day + timedelta(days=rng.choice((0, 0, 0, 1))) if copy else day
+            records.append({
+                "name": _variant(name, rng) if copy else name,
+                "startDate": record_day.isoformat() if rng.random() < 0.9 else None,
+                "url": f"https://{brand.lower()}-{event_id}.example.com/" + ("2026" if rng.random() < 0.5 else ""),
+                "source": rng.choice(sources),
+            })
+            labels.append(event_id)
+        event_id += 1
+
+    return records, labels
+
+
+def load_gold(path: Path = GOLD_PATH) -> tuple[list[dict], list[int]]:
+    with open(path, encoding="utf-8") as f:
+        clusters = json.load(f)["clusters"]
+    records, labels = [], []
+    for label, cluster in enumerate(clusters):
+        for record in cluster:
+            records.append(dict(record))
+            labels.append(label)
+    return records, labels
+
+
+def pairwise_scores(clusters: list[list[dict]], labels_by_record: dict[int, int]) -> tuple[float, float]:
+    """Pairwise precision and recall of predicted clusters against labels."""
+    def pairs(n: int) -> int:
+        return n * (n - 1) // 2
+
+    predicted = true_positive = 0
+    for cluster in clusters:
+        predicted += pairs(len(cluster))
+        counts: dict[int, int] = {}
+        for record in cluster:
+            label = labels_by_record[id(record)]
+            counts[label] = counts.get(label, 0) + 1
+        true_positive += sum(pairs(n) for n in counts.values())
+
+    sizes: dict[int, int] = {}
+    for label in labels_by_record.values():
+        sizes[label] = sizes.get(label, 0) + 1
+    actual = sum(pairs(n) for n in sizes.values())
+
+    precision = true_positive / predicted if predicted else 1.0
+    recall = true_positive / actual if actual else 1.0
+    return precision, recall
+
+
+def run(records: list[dict], labels: list[int], measure_memory: bool) -> dict:
+    labels_by_record = {id(r): label for r, label in zip(records, labels)}
+
+    start = time.perf_counter()
+    clusters = find_clusters(records)
+    elapsed = time.perf_counter() - start
+
+    peak_mb = None
+    if measure_memory:
+        tracemalloc.start()
+        find_clusters(records)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+
+    precision, recall = pairwise_scores(clusters, labels_by_record)
+    return {
+        "records": len(records),
+        "clusters": len(clusters),
+        "seconds": elapsed,
+        "per_second": len(records) / elapsed if elapsed else float("inf"),
+        "peak_mb": peak_mb,
+        "precision": precision,
+        "recall": recall,
+        "result": clusters,
+        "labels": labels_by_record,
+    }
+
+
+def run_blocking(records: list[dict]) -> dict:
+    """Time candidate_pairs on the distinct blocking keys, as find_clusters calls it."""
+    keys = list({MatchFeatures(r).key for r in records})
+    start = time.perf_counter()
+    pairs = sum(1 for _ in candidate_pairs(keys))
+    return {"keys": len(keys), "pairs": pairs, "seconds": time.perf_counter() - start}
+
+
+def print_row(label: str, stats: dict):
+    memory = f"{stats['peak_mb']:8.1f} MB" if stats["peak_mb"] is not None else "       - MB"
+    print(
+        f"  {label:<10} {stats['records']:>9,d} records  {stats['seconds']:8.2f}s  "
+        f"{stats['per_second']:>9,.0f} rec/s  {memory}  "
+        f"P={stats['precision']:.3f}  R={stats['recall']:.3f}"
+    )
+
+
+def print_gold_errors(stats: dict):
+    """List the gold pairs that were merged wrongly or missed."""
+    labels = stats["labels"]
+    cluster_of = {id(r): i for i, cluster in enumerate(stats["result"]) for r in cluster}
+    records = [r for cluster in stats["result"] for r in cluster]
+    for i, a in enumerate(records):
+        for b in records[i + 1:]:
+            same_label = labels[id(a)] == labels[id(b)]
+            same_cluster = cluster_of[id(a)] == cluster_of[id(b)]
+            if same_label != same_cluster:
+                kind = "missed" if same_label else "false merge"
+                print(f"    {kind:<11} {a['name']!r} ({a.get('startDate')}) ~ {b['name']!r} ({b.get('startDate')})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated synthetic sizes (e.g. 1k,10k,100k,1M)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--gold", type=Path, default=GOLD_PATH)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced run used for peak memory")
+    parser.add_argument("--verbose", action="store_true", help="List gold-set mistakes")
+    args = parser.parse_args()
+
+    print("Gold set:")
+    records, labels = load_gold(args.gold)
+    stats = run(records, labels, not args.no_memory)
+    print_row("gold", stats)
+    if args.verbose:
+        print_gold_errors(stats)
+
+    print("\nSynthetic:")
+    for size in (parse_size(s) for s in args.sizes.split(",")):
+        records, labels = generate(size, args.seed)
+        print_row(f"{size:,d}", run(records, labels, not args.no_memory))
+        blocking = run_blocking(records)
+        print(
+            f"  {'':<10} {blocking['keys']:>9,d} keys     {blocking['seconds']:8.2f}s  "
+            f"{blocking['pairs']:>9,d} candidate pairs (blocking only)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+HTML Parsing Benchmark
+
+Compares the BeautifulSoup extraction the scrapers used to do against the
+utils.html_extract engines (pure-Python and lxml) on WikiCFP and Papercall
+listing pages, and checks that every engine extracts the same links.
+
+Usage:
+    python scripts/benchmarks/bench_html_parsing.py [--pages DIR] [--save] [--repeat N]
+
+Pages are read from DIR (files named wikicfp*.html / papercall*.html).
+--save downloads fresh copies into DIR first. Without any saved pages,
+synthetic pages with the same markup structure are generated.
+
+Real listing pages are not always well-formed, so the engines are also
+checked on small malformed snippets. html_extract closes unclosed rows
+and cells the way HTML parsers (and lxml) do; the old BeautifulSoup
+html.parser path nests an implied <tr>/<td> instead, so it is shown for
+comparison only.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sources import papercall, wikicfp
+from utils.html_extract import HAS_LXML, Link, extract_links
+
+try:
+    from bs4 import BeautifulSoup
+    HAS_BS4 = True
+except ImportError:
+    HAS_BS4 = False
+
+
+DEFAULT_PAGES_DIR = Path(__file__).parent / "pages"
+
+PAGE_KINDS = {
+    # kind: (href pattern, separator, with_rows)
+    "wikicfp": (wikicfp.EVENT_LINK_PATTERN, "", True),
+    "papercall": (papercall.EVENT_LINK_PATTERN, " ", False),
+}
+
+
+# label: (html, href pattern, separator, with_rows)
+MALFORMED_PAGES = {
+    "row left open at </table>": (
+        '<table><tr><td>x<td>y</table><a href="/cfp/servlet/event.showcfp?eventid=1">E1</a>',
+        wikicfp.EVENT_LINK_PATTERN, "", True),
+    "implied </tr>": (
+        '<table><tr><td><a href="/cfp/servlet/event.showcfp?eventid=1">E1</a>'
+        '<tr><td>When<a href="/cfp/servlet/event.showcfp?eventid=2">E2</a></table>',
+        wikicfp.EVENT_LINK_PATTERN, "", True),
+    "implied </td>": (
+        '<table><tr><td>a<td>b<a href="/cfp/servlet/event.showcfp?eventid=1">E1</a></tr></table>',
+        wikicfp.EVENT_LINK_PATTERN, "", True),
+    "nested table left open": (
+        '<table><tr><td>o<table><tr><td>i</table>'
+        '<a href="/cfp/servlet/event.showcfp?eventid=1">E1</a></td></tr></table>',
+        wikicfp.EVENT_LINK_PATTERN, "", True),
+    "anchor left open": (
+        '<div><h3><a href="/conf-1">Conf 1</h3></div><a href="/conf-2">Conf 2</a>',
+        papercall.EVENT_LINK_PATTERN, " ", False),
+}
+
+
+def bs4_extract(html: str, href_pattern, separator: str, with_rows: bool) -> list[Link]:
+    """The previous full-tree BeautifulSoup path, as a reference."""
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
+    for a in soup.find_all("a", href=href_pattern):
+        row_cells = None
+        if with_rows:
+            tr = a.find_parent("tr")
+            if tr:
+                row_cells = [td.get_text(strip=True) for td in tr.find_all("td")]
+        links.append(Link(href=a.get("href", ""), text=a.get_text(separator=separator, strip=True), row_cells=row_cells))
+    return links
+
+
+def synthetic_wikicfp_page(rows: int = 20) -> str:
+    """A page shaped like a WikiCFP category listing."""
+    parts = ['<html><head><title>Call For Papers</title></head><body>',
+             '<table width="100%"><tr><td><a href="/cfp/">Home</a> | <a href="/cfp/allcat">Categories</a></td></tr></table>',
+             '<table cellpadding="3" cellspacing="1" align="center" width="100%">',
+             '<tr bgcolor="#bbbbbb"><td>Event</td><td>When</td><td>Where</td><td>Deadline</td></tr>']
+    for i in range(rows):
+        parts.append(
+            f'<tr bgcolor="#f6f6f6"><td rowspan="2" align="left">'
+            f'<a href="/cfp/servlet/event.showcfp?eventid={180000 + i}&amp;copyownerid={i}">CONF{i} 2026</a></td>'
+            f'<td align="left" colspan="3">International Conference on Topic {i} &amp; Applications</td></tr>'
+            f'<tr bgcolor="#f6f6f6"><td align="left">Jun {i % 28 + 1}, 2026 - Jun {i % 28 + 3}, 2026</td>'
+            f'<td align="left">City {i}, Country</td><td align="left">Mar {i % 28 + 1}, 2026</td></tr>'
+        )
+    parts.append('</table><div class="footer"><a href="/cfp/about">About</a></div></body></html>')
+    return "".join(parts)
+
+
+def synthetic_papercall_page(cards: int = 60) -> str:
+    """A page shaped like the Papercall events directory."""
+    parts = ['<html><body><nav><a href="/events">Events</a><a href="/pricing">Pricing</a></nav><div class="events">']
+    for i in range(cards):
+        parts.append(
+            f'<div class="event-card"><h3><a href="/conf-{i}-2026">Conf {i} 2026 - City {i}, Country</a></h3>'
+            f'<p class="meta"><span>CFP closes in {i} days</span> <a href="https://example.com/{i}">Website</a></p></div>'
+        )
+    parts.append('</div></body></html>')
+    return "".join(parts)
+
+
+def load_pages(pages_dir: Path) -> dict[str, list[str]]:
+    pages = {kind: [] for kind in PAGE_KINDS}
+    if pages_dir.is_dir():
+        for path in sorted(pages_dir.glob("*.html")):
+            for kind in PAGE_KINDS:
+                if path.name.startswith(kind):
+                    pages[kind].append(path.read_text(encoding="utf-8", errors="replace"))
+    for kind, generator in (("wikicfp", synthetic_wikicfp_page), ("papercall", synthetic_papercall_page)):
+        if not pages[kind]:
+            print(f"No saved {kind} pages in {pages_dir}, using synthetic pages")
+            pages[kind] = [generator() for _ in range(3)]
+    return pages
+
+
+def save_pages(pages_dir: Path):
+    from utils import http_client
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    targets = [(f"wikicfp_{i}.html", f"{wikicfp.BASE_URL}/cfp/call?conference=machine%20learning&page={i}") for i in (1, 2, 3)]
+    targets.append(("papercall_1.html", papercall.PAPERCALL_URL))
+    for filename, url in targets:
+        response = http_client.get(url, use_cache=False)
+        response.raise_for_status()
+        (pages_dir / filename).write_text(response.text, encoding="utf-8")
+        print(f"Saved {url} -> {pages_dir / filename}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=Path, default=DEFAULT_PAGES_DIR)
+    parser.add_argument("--save", action="store_true", help="Download fresh pages into --pages first")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.save:
+        save_pages(args.pages)
+    pages = load_pages(args.pages)
+
+    engines = {}
+    if HAS_BS4:
+        engines["bs4"] = bs4_extract
+    engines["python"] = lambda html, *a: extract_links(html, *a, engine="python")
+    if HAS_LXML:
+        engines["lxml"] = lambda html, *a: extract_links(html, *a, engine="lxml")
+
+    for kind, (pattern, separator, with_rows) in PAGE_KINDS.items():
+        docs = pages[kind]
+        size_kb = sum(len(d) for d in docs) / 1024
+        print(f"\n{kind}: {len(docs)} pages, {size_kb:.0f} KB")
+
+        reference = None
+        baseline = None
+        for name, engine in engines.items():
+            outputs = [engine(d, pattern, separator, with_rows) for d in docs]
+            if reference is None:
+                reference = outputs
+                match = "reference"
+            else:
+                match = "match" if outputs == reference else "MISMATCH"
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for d in docs:
+                    engine(d, pattern, separator, with_rows)
+            per_page = (time.perf_counter() - start) / (args.repeat * len(docs)) * 1000
+            baseline = baseline or per_page
+            links = sum(len(o) for o in outputs)
+            print(f"  {name:<8} {per_page:8.3f} ms/page  {baseline / per_page:5.1f}x  {links:5d} links  [{match}]")
+
+    print("\nmalformed markup (python vs lxml):")
+    for label, (html, pattern, separator, with_rows) in MALFORMED_PAGES.items():
+        outputs = {name: engine(html, pattern, separator, with_rows) for name, engine in engines.items()}
+        if "lxml" in outputs:
+            match = "match" if outputs["python"] == outputs["lxml"] else "MISMATCH"
+        else:
+            match = "lxml not installed"
+        if "bs4" in outputs:
+            match += ", same as bs4" if outputs["python"] == outputs["bs4"] else ", differs from bs4"
+        print(f"  {label:<26} [{match}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,8 @@ Outputs merged, deduplicated data to public/data/conferences.json
 """
 
 import json
-import re
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from typing import Optional
 from pathlib import Path
@@ -20,10 +20,27 @@ import requests
 from bs4 import BeautifulSoup
 from dateutil.parser import parse as parse_date
 
+from utils import http_client
+from utils.keyword_automaton import KeywordAutomaton
+from utils.tag_extractor import TagExtractor
+from utils.text_normalize import slugify
+
 
 # Configuration
 GITHUB_BASE_URL = "https://raw.githubusercontent.com/tech-conferences/conference-data/main/conferences"
 SESSIONIZE_EXPLORE_URL = "https://sessionize.com/app/speaker/opportunities"
+
+# Known Sessionize CFP URLs - add new ones here
+# You can find these by searching for "sessionize.com" in conference listings
+SESSIONIZE_CFPS = [
+    # Add known Sessionize CFP URLs here, e.g.:
+    # "https://sessionize.com/techorama-2026",
+    # "https://sessionize.com/ndc-oslo-2026",
+]
+
+# Sessionize pages scraped at once, and the (connect, read) timeout per page
+SESSIONIZE_MAX_WORKERS = 8
+SESSIONIZE_PAGE_TIMEOUT = (5, 15)
 OUTPUT_PATH = Path("public/data/conferences.json")
 
 # Domain classification keywords with priority scoring
@@ -79,6 +96,36 @@ FINANCIAL_AID_KEYWORDS = [
     "opportunity grant", "diversity fund", "inclusion"
 ]
 
+# Compiled once and matched in one pass per text. The financial aid table
+# is short enough that a plain substring scan is faster
+DOMAIN_AUTOMATON = KeywordAutomaton(DOMAIN_KEYWORDS)
+
+# Tech tags and the keywords that imply them (substring matches)
+TAG_KEYWORDS = {
+    "react": ["react", "reactjs", "react.js"],
+    "vue": ["vue", "vuejs", "vue.js"],
+    "angular": ["angular"],
+    "typescript": ["typescript", "ts"],
+    "javascript": ["javascript", "js", "ecmascript"],
+    "python": ["python", "django", "flask", "fastapi"],
+    "rust": ["rust", "rustlang"],
+    "go": ["golang", " go "],
+    "java": ["java", "jvm", "spring"],
+    "kotlin": ["kotlin"],
+    "swift": ["swift", "swiftui"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "docker": ["docker", "container"],
+    "aws": ["aws", "amazon web services"],
+    "graphql": ["graphql"],
+    "api": ["api", "rest", "restful"],
+    "microservices": ["microservices", "micro-services"],
+    "testing": ["testing", "qa", "quality assurance", "tdd"],
+    "performance": ["performance", "optimization"],
+    "accessibility": ["accessibility", "a11y"],
+}
+
+TAG_EXTRACTOR = TagExtractor(TAG_KEYWORDS, word_boundary=False)
+
 # Country to continent mapping (common countries)
 COUNTRY_CONTINENTS = {
     "U.S.A.": "North America", "USA": "North America", "United States": "North America",
@@ -112,11 +159,7 @@ def classify_domain(name: str, description: str = "") -> str:
     """Classify a conference into a domain based on keywords."""
     text = f"{name} {description}".lower()
 
-    domain_scores = {}
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        score = sum(1 for keyword in keywords if keyword in text)
-        if score > 0:
-            domain_scores[domain] = score
+    domain_scores = DOMAIN_AUTOMATON.scores(text)
 
     if domain_scores:
         return max(domain_scores, key=domain_scores.get)
@@ -157,8 +200,7 @@ def detect_financial_aid(description: str = "", name: str = "") -> dict:
 
 def generate_id(name: str, start_date: str) -> str:
     """Generate unique ID from name and date."""
-    slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
-    return f"{slug}-{start_date}"
+    return f"{slugify(name)}-{start_date}"
 
 
 def calculate_cfp_days_remaining(cfp_end_date: str) -> int:
@@ -175,38 +217,7 @@ def calculate_cfp_days_remaining(cfp_end_date: str) -> int:
 def extract_tags(name: str, description: str = "") -> list:
     """Extract technology tags from conference name/description."""
     text = f"{name} {description}".lower()
-
-    tag_keywords = {
-        "react": ["react", "reactjs", "react.js"],
-        "vue": ["vue", "vuejs", "vue.js"],
-        "angular": ["angular"],
-        "typescript": ["typescript", "ts"],
-        "javascript": ["javascript", "js", "ecmascript"],
-        "python": ["python", "django", "flask", "fastapi"],
-        "rust": ["rust", "rustlang"],
-        "go": ["golang", " go "],
-        "java": ["java", "jvm", "spring"],
-        "kotlin": ["kotlin"],
-        "swift": ["swift", "swiftui"],
-        "kubernetes": ["kubernetes", "k8s"],
-        "docker": ["docker", "container"],
-        "aws": ["aws", "amazon web services"],
-        "graphql": ["graphql"],
-        "api": ["api", "rest", "restful"],
-        "microservices": ["microservices", "micro-services"],
-        "testing": ["testing", "qa", "quality assurance", "tdd"],
-        "performance": ["performance", "optimization"],
-        "accessibility": ["accessibility", "a11y"],
-    }
-
-    found_tags = []
-    for tag, keywords in tag_keywords.items():
-        for keyword in keywords:
-            if keyword in text and tag not in found_tags:
-                found_tags.append(tag)
-                break
-
-    return found_tags
+    return TAG_EXTRACTOR.extract(text)
 
 
 def fetch_confs_tech_data() -> list:
@@ -229,7 +240,7 @@ def fetch_confs_tech_data() -> list:
         for topic in topics:
             url = f"{GITHUB_BASE_URL}/{year}/{topic}.json"
             try:
-                response = requests.get(url, timeout=10)
+                response = http_client.get(url)
                 if response.status_code == 200:
                     data = response.json()
                     for conf in data:
@@ -314,43 +325,54 @@ def fetch_sessionize_cfps() -> list:
     This function scrapes individual Sessionize CFP pages using the same approach
     as the Scrapionize .NET library (https://github.com/rickvdbosch/scrapionize).
     
-    To add more Sessionize events, add their URLs to the SESSIONIZE_CFPS list below.
+    To add more Sessionize events, add their URLs to SESSIONIZE_CFPS at the top
+    of this module.
     """
-    conferences = []
-    
-    # Known Sessionize CFP URLs - add new ones here
-    # You can find these by searching for "sessionize.com" in conference listings
-    SESSIONIZE_CFPS = [
-        # Add known Sessionize CFP URLs here, e.g.:
-        # "https://sessionize.com/techorama-2026",
-        # "https://sessionize.com/ndc-oslo-2026",
-    ]
-    
     if not SESSIONIZE_CFPS:
         print("[INFO] Sessionize: No CFP URLs configured")
         print("       Add Sessionize CFP URLs to SESSIONIZE_CFPS list in fetch_confs.py")
         return []
     
-    print(f"[INFO] Sessionize: Scraping {len(SESSIONIZE_CFPS)} known CFP pages...")
+    print(f"[INFO] Sessionize: Scraping {len(SESSIONIZE_CFPS)} known CFP pages "
+          f"({SESSIONIZE_MAX_WORKERS} at a time)...")
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; conf-finder/2.0; +https://github.com/mohitmishra786/conf-finder)"
-    }
+    # Pages share the pooled session in utils.http_client, so connections
+    # to sessionize.com are reused across workers
+    with ThreadPoolExecutor(max_workers=SESSIONIZE_MAX_WORKERS, thread_name_prefix="sessionize") as executor:
+        outcomes = list(executor.map(_scrape_sessionize_safely, SESSIONIZE_CFPS))
     
-    for url in SESSIONIZE_CFPS:
-        try:
-            conf = scrape_sessionize_cfp_page(url, headers)
-            if conf:
-                conferences.append(conf)
-                print(f"  [OK] Scraped: {conf['name']}")
-        except Exception as e:
-            print(f"  [FAIL] Failed to scrape {url}: {e}")
+    conferences = []
+    skipped = []
+    failed = []
+    for url, (conf, error) in zip(SESSIONIZE_CFPS, outcomes):
+        if error:
+            failed.append((url, error))
+        elif conf:
+            conferences.append(conf)
+            print(f"  [OK] Scraped: {conf['name']}")
+        else:
+            skipped.append(url)
     
     print(f"[OK] Fetched {len(conferences)} CFPs from Sessionize")
+    if skipped or failed:
+        print(f"[WARN] Sessionize: {len(skipped)} pages without event data, {len(failed)} failed")
+        for url in skipped:
+            print(f"  [SKIP] {url}")
+        for url, error in failed:
+            print(f"  [FAIL] {url}: {error}")
+    
     return conferences
 
 
-def scrape_sessionize_cfp_page(url: str, headers: dict) -> Optional[dict]:
+def _scrape_sessionize_safely(url: str) -> tuple:
+    """Scrape one page, returning (conference or None, error message or None)."""
+    try:
+        return scrape_sessionize_cfp_page(url), None
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+def scrape_sessionize_cfp_page(url: str, headers: Optional[dict] = None) -> Optional[dict]:
     """
     Scrape a single Sessionize CFP page.
     
@@ -360,7 +382,7 @@ def scrape_sessionize_cfp_page(url: str, headers: dict) -> Optional[dict]:
     - Left column (2nd ibox-content): Event dates, location, website
     - Right column (3rd ibox-content): CFP dates, travel/accommodation info
     """
-    response = requests.get(url, headers=headers, timeout=15)
+    response = http_client.get(url, headers=headers, timeout=SESSIONIZE_PAGE_TIMEOUT)
     if response.status_code != 200:
         return None
     
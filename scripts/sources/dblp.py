@@ -8,9 +8,12 @@ Data: XML response with conference metadata
 This replaces direct IEEE/ACM scraping as dblp aggregates both.
 """
 
-import requests
 import xml.etree.ElementTree as ET
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+from utils import http_client
+from utils.fetch_runner import deadline_reached, submit_in_context
 
 
 DBLP_SEARCH_URL = "https://dblp.org/search/venue/api"
@@ -25,18 +28,30 @@ SEARCH_TERMS = [
     "ACM conference 2026",
 ]
 
+# Venue search results change rarely; reuse cached answers for a week
+QUERY_MAX_AGE = 7 * 24 * 3600
+
+# Queries in flight at once (dblp.org is also paced by utils.rate_limiter)
+MAX_PARALLEL_QUERIES = 4
+
 
 def fetch() -> list[dict]:
-    """Fetch conferences from dblp.org API."""
+    """Fetch conferences from dblp.org API, running search terms concurrently."""
     conferences = []
     seen_urls = set()
     
-    for term in SEARCH_TERMS:
-        results = _search_venues(term)
-        for conf in results:
-            if conf["url"] not in seen_urls:
-                seen_urls.add(conf["url"])
-                conferences.append(conf)
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_QUERIES, thread_name_prefix="dblp") as executor:
+        futures = [submit_in_context(executor, _search_venues, term) for term in SEARCH_TERMS]
+        
+        # Merge in SEARCH_TERMS order so the output doesn't depend on timing
+        for future in futures:
+            for conf in future.result():
+                if conf["url"] not in seen_urls:
+                    seen_urls.add(conf["url"])
+                    conferences.append(conf)
+    
+    if deadline_reached():
+        print("[dblp] Deadline reached, returning partial results")
     
     print(f"[dblp] Fetched {len(conferences)} conferences")
     return conferences
@@ -44,59 +59,72 @@ def fetch() -> list[dict]:
 
 def _search_venues(query: str, max_results: int = 50) -> list[dict]:
     """Search dblp venues API."""
-    conferences = []
+    if deadline_reached():
+        return []
     
+    conferences = []
     try:
-        params = {
-            "q": query,
-            "format": "xml",
-            "h": max_results,
-        }
-        response = requests.get(DBLP_SEARCH_URL, params=params, timeout=15)
-        response.raise_for_status()
-        
-        root = ET.fromstring(response.content)
-        hits = root.find("hits")
-        if hits is None:
-            return []
-        
-        for hit in hits.findall("hit"):
-            info = hit.find("info")
-            if info is None:
-                continue
-            
-            venue = info.find("venue")
-            url_elem = info.find("url")
-            
-            if venue is None or venue.text is None:
-                continue
-            
-            name = venue.text.strip()
-            url = url_elem.text if url_elem is not None else ""
-            
-            # Determine domain from name
-            domain = _classify_academic_domain(name)
-            
-            conference = {
-                "name": name,
-                "url": url,
-                "startDate": None,  # dblp doesn't provide exact dates
-                "endDate": None,
-                "location": {"city": "", "country": "", "raw": ""},
-                "online": False,
-                "cfp": None,
-                "domain": domain,
-                "source": "dblp",
-            }
-            
+        for conference in _iter_venues(query, max_results):
             conferences.append(conference)
-    
     except Exception as e:
         print(f"[dblp] Error searching '{query}': {e}")
     
     return conferences
 
 
+def _iter_venues(query: str, max_results: int = 50) -> Iterator[dict]:
+    """Yield venues from a dblp search while the XML response streams in."""
+    params = {
+        "q": query,
+        "format": "xml",
+        "h": max_results,
+    }
+    parser = ET.XMLPullParser(events=("end",))
+    
+    for chunk in http_client.stream(DBLP_SEARCH_URL, params=params, max_age=QUERY_MAX_AGE):
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag != "hit":
+                continue
+            conference = _parse_hit(elem)
+            elem.clear()
+            if conference:
+                yield conference
+    
+    parser.close()
+
+
+def _parse_hit(hit: ET.Element) -> Optional[dict]:
+    """Convert one <hit> element to a Conference dict."""
+    info = hit.find("info")
+    if info is None:
+        return None
+    
+    venue = info.find("venue")
+    url_elem = info.find("url")
+    
+    if venue is None or venue.text is None:
+        return None
+    
+    name = venue.text.strip()
+    url = url_elem.text if url_elem is not None else ""
+    
+    # Determine domain from name
+    domain = _classify_academic_domain(name)
+    
+    return {
+        "name": name,
+        "url": url,
+        "startDate": None,  # dblp doesn't provide exact dates
+        "endDate": None,
+        "location": {"city": "", "country": "", "raw": ""},
+        "online": False,
+        "cfp": None,
+        "domain": domain,
+        "source": "dblp",
+    }
+
+
 def _classify_academic_domain(name: str) -> str:
     """Classify academic conference by domain."""
     name_lower = name.lower()
@@ -5,69 +5,87 @@ This is the PRIMARY source with 1000+ CFPs, well-structured JSON.
 URL: https://developers.events/all-cfps.json
 """
 
-import requests
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
+
+from utils import http_client
+from utils.json_stream import iter_array_items
+
+
+ALL_CFPS_URL = "https://developers.events/all-cfps.json"
 
 
 def fetch() -> list[dict]:
     """Fetch all CFPs from developers.events API."""
-    url = "https://developers.events/all-cfps.json"
+    conferences = []
     
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        for conference in stream():
+            conferences.append(conference)
     except Exception as e:
         print(f"[developers_events] Error fetching: {e}")
-        return []
-    
-    conferences = []
-    for item in data:
-        conf = item.get("conf", {})
-        if not conf.get("name"):
-            continue
-        
-        # Parse dates
-        dates = conf.get("date", [])
-        start_date = _timestamp_to_date(dates[0]) if dates else None
-        end_date = _timestamp_to_date(dates[-1]) if len(dates) > 1 else start_date
-        
-        # Parse CFP deadline
-        cfp_end_date = _timestamp_to_date(item.get("untilDate"))
-        cfp_url = item.get("link", "")
-        
-        # Determine if online
-        location = conf.get("location", "")
-        is_online = "online" in location.lower()
-        
-        # Extract country from location
-        city, country = _parse_location(location)
-        
-        conference = {
-            "name": conf.get("name", "").strip(),
-            "url": conf.get("hyperlink", ""),
-            "startDate": start_date,
-            "endDate": end_date,
-            "location": {
-                "city": city,
-                "country": country,
-                "raw": location,
-            },
-            "online": is_online,
-            "cfp": {
-                "url": cfp_url,
-                "endDate": cfp_end_date,
-            } if cfp_url else None,
-            "source": "developers.events",
-        }
-        
-        conferences.append(conference)
+        if not conferences:
+            return []
+        print(f"[developers_events] Keeping {len(conferences)} conferences parsed before the error")
     
     print(f"[developers_events] Fetched {len(conferences)} conferences")
     return conferences
 
 
+def stream() -> Iterator[dict]:
+    """
+    Yield normalized conferences while all-cfps.json is still downloading.
+    
+    The feed is parsed item by item, so memory stays flat as it grows and
+    callers can start processing before the download finishes.
+    """
+    for item in iter_array_items(http_client.stream(ALL_CFPS_URL)):
+        conference = _normalize(item)
+        if conference:
+            yield conference
+
+
+def _normalize(item: dict) -> Optional[dict]:
+    """Convert one all-cfps.json entry to a Conference dict."""
+    conf = item.get("conf", {})
+    if not conf.get("name"):
+        return None
+    
+    # Parse dates
+    dates = conf.get("date", [])
+    start_date = _timestamp_to_date(dates[0]) if dates else None
+    end_date = _timestamp_to_date(dates[-1]) if len(dates) > 1 else start_date
+    
+    # Parse CFP deadline
+    cfp_end_date = _timestamp_to_date(item.get("untilDate"))
+    cfp_url = item.get("link", "")
+    
+    # Determine if online
+    location = conf.get("location", "")
+    is_online = "online" in location.lower()
+    
+    # Extract country from location
+    city, country = _parse_location(location)
+    
+    return {
+        "name": conf.get("name", "").strip(),
+        "url": conf.get("hyperlink", ""),
+        "startDate": start_date,
+        "endDate": end_date,
+        "location": {
+            "city": city,
+            "country": country,
+            "raw": location,
+        },
+        "online": is_online,
+        "cfp": {
+            "url": cfp_url,
+            "endDate": cfp_end_date,
+        } if cfp_url else None,
+        "source": "developers.events",
+    }
+
+
 def _timestamp_to_date(ts: Optional[int]) -> Optional[str]:
     """Convert Unix timestamp (ms) to ISO date string."""
     if not ts:
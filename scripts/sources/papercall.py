@@ -2,16 +2,18 @@
 Scrape events from Papercall.io
 
 URL: https://www.papercall.io/events
-Method: BeautifulSoup HTML parsing
+Method: HTML link extraction (utils.html_extract)
 """
 
-import requests
-from bs4 import BeautifulSoup
 from typing import Optional
 import re
 
+from utils import http_client
+from utils.html_extract import extract_links
+
 
 PAPERCALL_URL = "https://www.papercall.io/events"
+EVENT_LINK_PATTERN = re.compile(r"^/[a-z0-9-]+$")
 
 
 def fetch() -> list[dict]:
@@ -19,20 +21,19 @@ def fetch() -> list[dict]:
     conferences = []
     
     try:
-        response = requests.get(PAPERCALL_URL, timeout=30)
+        response = http_client.get(PAPERCALL_URL)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
         
         # Find event cards
-        event_links = soup.find_all("a", href=re.compile(r"^/[a-z0-9-]+$"))
+        event_links = extract_links(response.text, EVENT_LINK_PATTERN, separator=" ")
         
         for link in event_links:
-            href = link.get("href", "")
+            href = link.href
             if not href or href in ["/events", "/pricing", "/about", "/contact"]:
                 continue
             
             # Extract event name and location from the card
-            text = link.get_text(separator=" ", strip=True)
+            text = link.text
             if not text or len(text) < 3:
                 continue
             
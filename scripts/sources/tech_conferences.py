@@ -5,15 +5,22 @@ URL: https://github.com/tech-conferences/conference-data
 Structure: /conferences/{year}/{topic}.json (e.g., javascript.json, python.json)
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from utils import http_client
+from utils.fetch_runner import deadline_reached
+
 # Base URL for raw GitHub content
 GITHUB_BASE = "https://raw.githubusercontent.com/tech-conferences/conference-data/main/conferences"
 GITHUB_API = "https://api.github.com/repos/tech-conferences/conference-data/contents/conferences"
 
 YEARS = [2025, 2026]
 
+# The GitHub contents API allows 60 unauthenticated requests per hour, so the
+# directory listing is reused for most of a day. Topic files are revalidated
+# with their ETag on every run.
+LISTING_MAX_AGE = 20 * 3600
+
 # Map confs.tech topics to our domains
 TOPIC_TO_DOMAIN: Dict[str, str] = {
     "javascript": "web",
@@ -60,7 +67,7 @@ def fetch() -> List[Dict]:
         # Get list of files for this year
         api_url = f"{GITHUB_API}/{year}"
         try:
-            resp = requests.get(api_url, timeout=10)
+            resp = http_client.get(api_url, max_age=LISTING_MAX_AGE)
             if resp.status_code == 404:
                 continue
             resp.raise_for_status()
@@ -71,6 +78,9 @@ def fetch() -> List[Dict]:
         
         # Fetch each topic file
         for file_info in files:
+            if deadline_reached():
+                print(f"[tech_conferences] Deadline reached, stopping at {year}")
+                break
             if not file_info.get("name", "").endswith(".json"):
                 continue
             
@@ -82,7 +92,7 @@ def fetch() -> List[Dict]:
                 if not data_url:
                     data_url = f"{GITHUB_BASE}/{year}/{file_info['name']}"
                 
-                data_resp = requests.get(data_url, timeout=10)
+                data_resp = http_client.get(data_url)
                 data_resp.raise_for_status()
                 items = data_resp.json()
             except Exception as e:
@@ -8,12 +8,16 @@ This module scrapes multiple categories with pagination to get comprehensive cov
 Based on http://www.wikicfp.com/cfp/allcat showing 9000+ CFPs per major category.
 """
 
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import re
 from datetime import datetime
 
+from utils import http_client
+from utils.crawl_frontier import CrawlFrontier
+from utils.fetch_runner import deadline_reached
+from utils.html_extract import extract_links
+from utils.paths import CACHE_DIR
+
 # Top CS/Tech categories from WikiCFP (mapped to our domains)
 # Each tuple: (wikicfp_category, our_domain)
 CATEGORIES = [
@@ -66,78 +70,138 @@ CATEGORIES = [
 ]
 
 BASE_URL = "http://www.wikicfp.com"
-MAX_PAGES_PER_CATEGORY = 3  # Limit pages to avoid rate limiting
+MAX_PAGES_PER_CATEGORY = 8  # Requests are paced by utils.rate_limiter
 CONFERENCES_PER_PAGE = 20
 
+# Conference links - format: /cfp/servlet/event.showcfp?eventid=XXX
+EVENT_LINK_PATTERN = re.compile(r"event\.showcfp\?eventid=")
+EVENT_ID_PATTERN = re.compile(r"eventid=(\d+)")
+
+# Known event IDs per category, kept between runs
+FRONTIER_PATH = CACHE_DIR / "wikicfp_frontier.json"
+# Days between full-depth re-crawls of a category
+REFRESH_INTERVAL_DAYS = 7
+
 
 def fetch() -> List[Dict]:
-    """Fetch conferences from WikiCFP across multiple categories."""
+    """
+    Fetch conferences from WikiCFP across multiple categories.
+    
+    Crawls incrementally: each category is paged only until a page holds
+    nothing but already-known events, and the stored records stand in for
+    the pages that were skipped. Every REFRESH_INTERVAL_DAYS a category is
+    crawled to full depth to refresh known events and drop stale ones.
+    """
     conferences: List[Dict] = []
     seen_urls: set = set()
+    frontier = CrawlFrontier(FRONTIER_PATH, REFRESH_INTERVAL_DAYS).load()
     
     total_categories = len(CATEGORIES)
     
     for idx, (category, domain) in enumerate(CATEGORIES):
-        print(f"[wikicfp] Fetching {category} ({idx+1}/{total_categories})...")
-        try:
-            category_confs = _fetch_category(category, domain)
-            for conf in category_confs:
-                # Deduplicate by URL
-                if conf["url"] not in seen_urls:
-                    seen_urls.add(conf["url"])
-                    conferences.append(conf)
-        except Exception as e:
-            print(f"[wikicfp] Error fetching {category}: {e}")
-            continue
+        if deadline_reached():
+            # Categories we could not reach still contribute their stored events
+            print(f"[wikicfp] Deadline reached, using stored events for {category}")
+            category_confs = frontier.records(category)
+        else:
+            print(f"[wikicfp] Fetching {category} ({idx+1}/{total_categories})...")
+            try:
+                category_confs = _fetch_category(category, domain, frontier)
+            except Exception as e:
+                print(f"[wikicfp] Error fetching {category}: {e}")
+                category_confs = frontier.records(category)
+        
+        current_year = datetime.now().year
+        for conf in category_confs:
+            if _is_past(conf["name"], current_year):
+                continue
+            # Deduplicate by URL
+            if conf["url"] not in seen_urls:
+                seen_urls.add(conf["url"])
+                conferences.append(conf)
+    
+    try:
+        frontier.save()
+    except OSError as e:
+        print(f"[wikicfp] Could not save crawl frontier: {e}")
     
     print(f"[wikicfp] Fetched {len(conferences)} conferences")
     return conferences
 
 
-def _fetch_category(category: str, domain: str) -> List[Dict]:
-    """Fetch conferences from a category with pagination."""
-    conferences: List[Dict] = []
+def _fetch_category(category: str, domain: str, frontier: CrawlFrontier) -> List[Dict]:
+    """Fetch a category's new events with pagination and merge them into the frontier."""
+    full_crawl = frontier.needs_full_crawl(category)
+    crawled: Dict[str, Dict] = {}
+    complete = True
     
     for page in range(1, MAX_PAGES_PER_CATEGORY + 1):
+        if deadline_reached():
+            complete = False
+            break
+        
         # Category page URL with pagination
         encoded_cat = category.replace(" ", "%20")
         url = f"{BASE_URL}/cfp/call?conference={encoded_cat}&page={page}"
         
         try:
-            response = requests.get(url, timeout=15, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; ConfScoutBot/1.0)"
-            })
+            response = http_client.get(url)
             if response.status_code == 404:
                 break
             response.raise_for_status()
         except Exception as e:
             print(f"[wikicfp] Page {page} failed for {category}: {e}")
+            complete = False
             break
         
-        soup = BeautifulSoup(response.text, "html.parser")
-        
         # Find conference table rows
-        page_confs = _parse_conference_list(soup, category, domain)
+        page_confs = _parse_conference_list(response.text, category, domain)
         
         if not page_confs:
             break  # No more conferences
         
-        conferences.extend(page_confs)
+        page_new = 0
+        for conf in page_confs:
+            event_id = _event_id(conf["url"])
+            if not frontier.is_known(category, event_id):
+                page_new += 1
+            crawled[event_id] = conf
+        
+        # Later pages only hold events we already have
+        if not full_crawl and page_new == 0:
+            break
     
-    return conferences
+    if full_crawl and complete:
+        frontier.replace(category, crawled)
+    else:
+        frontier.update(category, crawled)
+    
+    return frontier.records(category)
+
+
+def _event_id(url: str) -> str:
+    """Extract the eventid from a WikiCFP event URL (falls back to the URL)."""
+    match = EVENT_ID_PATTERN.search(url)
+    return match.group(1) if match else url
+
+
+def _is_past(name: str, current_year: int) -> bool:
+    """Whether the year in a conference name is before the current year."""
+    year_match = re.search(r"20\d{2}", name)
+    return bool(year_match) and int(year_match.group(0)) < current_year
 
 
-def _parse_conference_list(soup: BeautifulSoup, category: str, domain: str) -> List[Dict]:
+def _parse_conference_list(html: str, category: str, domain: str) -> List[Dict]:
     """Parse conference list from WikiCFP page."""
     conferences: List[Dict] = []
     current_year = datetime.now().year
     
-    # Find conference links - format: /cfp/servlet/event.showcfp?eventid=XXX
-    links = soup.find_all("a", href=re.compile(r"event\.showcfp\?eventid="))
+    # Only the event links and their table rows are extracted, no full DOM
+    links = extract_links(html, EVENT_LINK_PATTERN, with_rows=True)
     
     for link in links:
-        name = link.get_text(strip=True)
-        href = link.get("href", "")
+        name = link.text
+        href = link.href
         
         if not name or not href:
             continue
@@ -154,18 +218,17 @@ def _parse_conference_list(soup: BeautifulSoup, category: str, domain: str) -> L
             continue
         
         # Try to find the table row with more info
-        parent_row = link.find_parent("tr")
+        cells = link.row_cells
         location = ""
         dates = None
         cfp_deadline = None
         
-        if parent_row:
-            cells = parent_row.find_all("td")
+        if cells:
             if len(cells) >= 3:
                 # WikiCFP format: Event | When | Where | Deadline
-                location = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+                location = cells[2] if len(cells) > 2 else ""
                 if len(cells) > 3:
-                    cfp_deadline = _parse_date(cells[3].get_text(strip=True))
+                    cfp_deadline = _parse_date(cells[3])
         
         conference = {
             "name": name,
@@ -0,0 +1,222 @@
+"""
+HTTP Cache Tests
+
+Runs utils.http_client against a local http.server stand-in and checks
+the on-disk cache: misses, fresh hits, ETag / Last-Modified revalidation
+(304) and size-capped eviction.
+
+Usage:
+    python -m unittest discover scripts/tests
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import http_client, http_fixtures
+from utils.http_cache import HTTPCache
+from utils.rate_limiter import HostRateLimiter
+
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    /etag       versioned with ETag (server.etag, server.body)
+    /modified   versioned with Last-Modified
+    /plain      no validators, so never cached
+    """
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+
+        headers = {"Content-Type": "text/plain"}
+        if self.path == "/etag":
+            headers["ETag"] = server.etag
+            not_modified = self.headers.get("If-None-Match") == server.etag
+        elif self.path == "/modified":
+            headers["Last-Modified"] = LAST_MODIFIED
+            not_modified = self.headers.get("If-Modified-Since") == LAST_MODIFIED
+        elif self.path == "/plain":
+            not_modified = False
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(304 if not_modified else 200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if not_modified:
+            self.end_headers()
+            return
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HTTPCacheTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.etag = ETAG
+        self.server.body = b"conference data"
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self._saved = (http_client.cache, http_client.rate_limiter, http_fixtures.HTTP_MODE)
+        http_client.cache = HTTPCache(Path(self._tmp.name))
+        http_client.rate_limiter = HostRateLimiter(default=(1000.0, 1000))
+        # Talk to the stand-in even in record/replay runs
+        http_fixtures.HTTP_MODE = "live"
+
+    def tearDown(self):
+        http_client.cache, http_client.rate_limiter, http_fixtures.HTTP_MODE = self._saved
+        self._tmp.cleanup()
+
+    def get(self, path: str, **kwargs):
+        return http_client.get(self.base_url + path, **kwargs)
+
+    def test_miss_fetches_and_stores(self):
+        response = self.get("/etag")
+
+        self.assertEqual(response.content, b"conference data")
+        self.assertFalse(getattr(response, "from_cache", False))
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertIsNotNone(http_client.cache.load(self.base_url + "/etag"))
+
+    def test_fresh_hit_skips_network(self):
+        self.get("/etag")
+        response = self.get("/etag", max_age=60)
+
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.content, b"conference data")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_etag_revalidation(self):
+        self.get("/etag")
+        response = self.get("/etag")
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[1][1].get("If-None-Match"), ETAG)
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.content, b"conference data")
+
+    def test_last_modified_revalidation(self):
+        self.get("/modified")
+        response = self.get("/modified")
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[1][1].get("If-Modified-Since"), LAST_MODIFIED)
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.content, b"conference data")
+
+    def test_revalidation_refreshes_entry_age(self):
+        self.get("/etag")
+        entry = http_client.cache.load(self.base_url + "/etag")
+        entry.stored_at -= 3600
+        http_client.cache._write_meta(entry)
+
+        self.get("/etag")
+
+        self.assertLess(http_client.cache.load(self.base_url + "/etag").age, 60)
+
+    def test_changed_resource_replaces_entry(self):
+        self.get("/etag")
+        self.server.etag = '"v2"'
+        self.server.body = b"new conference data"
+        response = self.get("/etag")
+
+        self.assertFalse(getattr(response, "from_cache", False))
+        self.assertEqual(response.content, b"new conference data")
+        entry = http_client.cache.load(self.base_url + "/etag")
+        self.assertEqual(entry.body, b"new conference data")
+        self.assertEqual(entry.headers["etag"], '"v2"')
+
+    def test_response_without_validators_not_cached(self):
+        self.get("/plain")
+        self.get("/plain")
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertIsNone(http_client.cache.load(self.base_url + "/plain"))
+
+    def test_use_cache_false_bypasses_cache(self):
+        self.get("/etag")
+        response = self.get("/etag", use_cache=False)
+
+        self.assertNotIn("If-None-Match", self.server.requests[1][1])
+        self.assertFalse(getattr(response, "from_cache", False))
+
+    def test_stream_revalidation(self):
+        url = self.base_url + "/etag"
+        first = b"".join(http_client.stream(url, chunk_size=4))
+        second = b"".join(http_client.stream(url, chunk_size=4))
+
+        self.assertEqual(first, b"conference data")
+        self.assertEqual(second, b"conference data")
+        self.assertEqual(self.server.requests[1][1].get("If-None-Match"), ETAG)
+
+
+class HTTPCacheEvictionTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def store(self, cache: HTTPCache, url: str, age: float):
+        """Store an incompressible body and backdate its last use."""
+        cache.store(url, os.urandom(1000), {"etag": '"x"'})
+        used = time.time() - age
+        os.utime(self.directory / f"{cache.key(url)}.gz", (used, used))
+
+    def test_evicts_least_recently_used(self):
+        cache = HTTPCache(self.directory, max_bytes=10_000)
+        self.store(cache, "https://a.example/", age=300)
+        self.store(cache, "https://b.example/", age=200)
+        # A hit makes "a" the most recently used
+        cache.load("https://a.example/")
+
+        body_size = (self.directory / f"{cache.key('https://a.example/')}.gz").stat().st_size
+        cache.max_bytes = 2 * body_size + body_size // 2
+        self.store(cache, "https://c.example/", age=0)
+
+        self.assertIsNotNone(cache.load("https://a.example/"))
+        self.assertIsNone(cache.load("https://b.example/"))
+        self.assertIsNotNone(cache.load("https://c.example/"))
+        self.assertFalse((self.directory / f"{cache.key('https://b.example/')}.json").exists())
+
+    def test_under_cap_keeps_everything(self):
+        cache = HTTPCache(self.directory)
+        for i in range(5):
+            self.store(cache, f"https://{i}.example/", age=i)
+
+        self.assertEqual(len(list(self.directory.glob("*.gz"))), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Classification Cache Module
+
+Persistent memo of domain classification and tag extraction results, so
+conference names seen on a previous run are not classified again. Each
+name is stored under a hash of its normalized (lowercased) text, and the
+whole store is tied to domain_classifier.TABLES_VERSION: editing the
+keyword tables or the classifier discards it automatically.
+
+Within a run, classify() and extract_tags() also keep an in-process LRU.
+"""
+
+import hashlib
+from pathlib import Path
+
+from utils.domain_classifier import TABLES_VERSION, classify_many, extract_tags_many
+from utils.state_file import load_state, save_state
+
+
+CLASSIFICATION_CACHE_VERSION = 1
+
+
+def text_key(name: str) -> str:
+    """Hash of the text classify() and extract_tags() actually look at."""
+    return hashlib.sha1(name.lower().encode()).hexdigest()[:16]
+
+
+class ClassificationCache:
+    """
+    State file layout:
+        {"version": 1,
+         "tables": "<TABLES_VERSION>",
+         "entries": {text_key: "domain|sub,domains|tags"}}
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+
+    def load(self) -> "ClassificationCache":
+        state = load_state(self.path, CLASSIFICATION_CACHE_VERSION)
+        self.entries = state.get("entries", {}) if state.get("tables") == TABLES_VERSION else {}
+        self.changed = not self.entries
+        return self
+
+    def save(self):
+        """Write the store, unless this run found it already up to date."""
+        if not self.changed:
+            return
+        save_state(self.path, CLASSIFICATION_CACHE_VERSION, {"tables": TABLES_VERSION, "entries": self.entries})
+        self.changed = False
+
+    def enrich_many(self, names: list[str]) -> list[tuple[str, list[str], list[str]]]:
+        """
+        (domain, sub_domains, tags) for each name. Only names the store
+        doesn't know are classified, in one batch; the store then keeps
+        exactly this run's names.
+        """
+        keys = [text_key(name) for name in names]
+        entries: dict[str, str] = {}
+        missing: dict[str, str] = {}
+        for name, key in zip(names, keys):
+            if key in entries or key in missing:
+                continue
+            if key in self.entries:
+                entries[key] = self.entries[key]
+            else:
+                missing[key] = name
+        self.hits = len(entries)
+        self.misses = len(missing)
+
+        if missing:
+            missing_names = list(missing.values())
+            domains = classify_many(missing_names)
+            tags = extract_tags_many(missing_names)
+            for key, (domain, sub_domains), name_tags in zip(missing, domains, tags):
+                entries[key] = f"{domain}|{','.join(sub_domains)}|{','.join(name_tags)}"
+
+        self.changed = self.changed or bool(missing) or len(entries) != len(self.entries)
+        self.entries = entries
+        return [_decode(entries[key]) for key in keys]
+
+
+def _decode(entry: str) -> tuple[str, list[str], list[str]]:
+    """Stored "domain|sub,domains|tags" back into fresh lists."""
+    domain, sub_domains, tags = entry.split("|")
+    return domain, sub_domains.split(",") if sub_domains else [], tags.split(",") if tags else []
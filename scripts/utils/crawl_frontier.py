@@ -0,0 +1,72 @@
+"""
+Crawl Frontier Module
+
+Persistent per-category record of the events a paginated crawl has already
+seen. Lets a crawler stop paging once it only finds known events, re-emit
+the stored records for the pages it skipped, and do a full refresh of each
+category on a slower schedule.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from utils.state_file import load_state, save_state
+
+
+FRONTIER_VERSION = 1
+
+
+class CrawlFrontier:
+    """
+    State file layout:
+        {"version": 1,
+         "categories": {category: {"lastFullCrawl": "YYYY-MM-DD",
+                                   "events": {event_id: {"record": {...},
+                                                         "lastSeen": "YYYY-MM-DD"}}}}}
+    """
+
+    def __init__(self, path: Path, refresh_days: int):
+        self.path = Path(path)
+        self.refresh_days = refresh_days
+        self.categories: dict[str, dict] = {}
+        self.today = datetime.now().strftime("%Y-%m-%d")
+
+    def load(self) -> "CrawlFrontier":
+        self.categories = load_state(self.path, FRONTIER_VERSION).get("categories", {})
+        return self
+
+    def save(self):
+        save_state(self.path, FRONTIER_VERSION, {"categories": self.categories})
+
+    def _category(self, category: str) -> dict:
+        return self.categories.setdefault(category, {"lastFullCrawl": None, "events": {}})
+
+    def needs_full_crawl(self, category: str) -> bool:
+        """True if the category was never fully crawled or its refresh is due."""
+        last = self._category(category).get("lastFullCrawl")
+        if not last:
+            return True
+        try:
+            due = datetime.strptime(last, "%Y-%m-%d") + timedelta(days=self.refresh_days)
+        except ValueError:
+            return True
+        return datetime.strptime(self.today, "%Y-%m-%d") >= due
+
+    def is_known(self, category: str, event_id: str) -> bool:
+        return event_id in self._category(category)["events"]
+
+    def update(self, category: str, records: dict[str, dict]):
+        """Add new events and refresh the stored copy of known ones."""
+        events = self._category(category)["events"]
+        for event_id, record in records.items():
+            events[event_id] = {"record": record, "lastSeen": self.today}
+
+    def replace(self, category: str, records: dict[str, dict]):
+        """Store the result of a complete crawl; events no longer listed are dropped."""
+        entry = self._category(category)
+        entry["events"] = {}
+        self.update(category, records)
+        entry["lastFullCrawl"] = self.today
+
+    def records(self, category: str) -> list[dict]:
+        return [e["record"] for e in self._category(category)["events"].values()]
@@ -0,0 +1,80 @@
+"""
+Dedup Index Module
+
+Persistent record of the previous deduplication run: which cluster every
+record ended up in, plus the match features it was clustered on. Records
+that come back unchanged are put straight back into their old cluster, so
+only new or changed records have to be compared. A full re-cluster runs on
+a slower schedule, and whenever the matching settings change.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from utils.state_file import load_state, save_state
+
+
+DEDUP_INDEX_VERSION = 1
+
+
+def record_fingerprint(conf: dict) -> str:
+    """Hash of the fields that decide how a record is clustered."""
+    fields = [conf.get("name"), conf.get("startDate"), conf.get("url"), conf.get("source")]
+    return hashlib.sha1(json.dumps(fields).encode()).hexdigest()[:16]
+
+
+class DedupIndex:
+    """
+    State file layout:
+        {"version": 1,
+         "settings": "<matching thresholds>",
+         "lastFullRebuild": "YYYY-MM-DD",
+         "records": {fingerprint: {"cluster": <representative fingerprint>,
+                                   "features": [...]}}}
+    """
+
+    def __init__(self, path: Path, rebuild_days: int):
+        self.path = Path(path)
+        self.rebuild_days = rebuild_days
+        self.settings: Optional[str] = None
+        self.last_full_rebuild: Optional[str] = None
+        self.records: dict[str, dict] = {}
+        self.today = datetime.now().strftime("%Y-%m-%d")
+
+    def load(self) -> "DedupIndex":
+        state = load_state(self.path, DEDUP_INDEX_VERSION)
+        self.settings = state.get("settings")
+        self.last_full_rebuild = state.get("lastFullRebuild")
+        self.records = state.get("records", {})
+        return self
+
+    def save(self):
+        save_state(self.path, DEDUP_INDEX_VERSION, {
+            "settings": self.settings,
+            "lastFullRebuild": self.last_full_rebuild,
+            "records": self.records,
+        })
+
+    def needs_full_rebuild(self, settings: str) -> bool:
+        """True if there is no usable state, the settings changed, or a rebuild is due."""
+        if not self.records or self.settings != settings or not self.last_full_rebuild:
+            return True
+        try:
+            due = datetime.strptime(self.last_full_rebuild, "%Y-%m-%d") + timedelta(days=self.rebuild_days)
+        except ValueError:
+            return True
+        return datetime.strptime(self.today, "%Y-%m-%d") >= due
+
+    def lookup(self, fingerprint: str) -> Optional[dict]:
+        """Stored {"cluster", "features"} for a record seen last run, if any."""
+        return self.records.get(fingerprint)
+
+    def replace(self, records: dict[str, dict], settings: str, full_rebuild: bool):
+        """Store this run's clustering; records that disappeared are dropped."""
+        self.records = records
+        self.settings = settings
+        if full_rebuild:
+            self.last_full_rebuild = self.today
@@ -4,10 +4,23 @@ Deduplication Module
 Smart merging of conferences from multiple sources.
 """
 
+import os
 import re
-from difflib import SequenceMatcher
+from datetime import datetime
+from functools import lru_cache
+from itertools import combinations, groupby
+from operator import itemgetter
 from typing import Optional
 
+from utils.dedup_index import DedupIndex, record_fingerprint
+from utils.merge import merge_records
+from utils.ngram_index import GRAM_SIZE, MIN_DICE, candidate_pairs, query_pairs
+from utils.series import SERIES_VERSION, acronyms, build_series_index, series_key
+from utils.similarity import DEFAULT_BACKEND, similar_many
+from utils.text_normalize import NORMALIZE_VERSION, normalize_name
+from utils.union_find import UnionFind
+from utils.url_canon import CANONICAL_VERSION, build_url_index, canonical_url
+
 
 # Source priority (higher = preferred)
 SOURCE_PRIORITY = {
@@ -20,131 +33,369 @@ SOURCE_PRIORITY = {
     "github-issues": 50,
 }
 
+# Years are left out of the blocking key: " 2026" alone would make every
+# short "ACRONYM 2026" name look similar
+YEAR_PATTERN = re.compile(r"(?:19|20)\d{2}")
+
+# Duplicate thresholds
+NAME_SIMILARITY = 0.75
+MAX_DATE_GAP_DAYS = 7
+
+# Series keys shorter than this ("cloud computing") are too generic to
+# join records on alone
+SERIES_MIN_WORDS = 3
+
+# Names with different blocking keys only pair up through the n-gram
+# index, and look-alike names of different events ("Dutch PHP" / "Dutch
+# AI", "IJCSA" / "IJCCSA") are common there. Such pairs must pass
+# _keys_agree, and with no start date on either side, a stricter score.
+UNDATED_NAME_SIMILARITY = 0.9
+KEY_RULES_VERSION = 1
+
+# "exact" reproduces difflib decisions whichever backend scores the names;
+# "calibrated" trusts the fast backend's score (see utils.similarity)
+SIMILARITY_EXACT = os.environ.get("CONFSCOUT_SIMILARITY_MODE", "exact") != "calibrated"
+
+
+class MatchFeatures:
+    """Everything the pairwise comparison needs, computed once per record."""
+    
+    __slots__ = ("name", "key", "tokens", "years", "day", "url", "series", "acronyms")
+    
+    def __init__(self, conf: Optional[dict] = None):
+        if conf is not None:
+            self._set(
+                _normalize_name(conf.get("name", "")), _parse_date(conf.get("startDate")),
+                canonical_url(conf.get("url")), series_key(conf.get("name")),
+                acronyms(conf.get("name")),
+            )
+    
+    def _set(self, name: str, day: Optional[int], url: str, series: str, name_acronyms):
+        self.name = name
+        self.tokens = frozenset(name.split())
+        self.years = frozenset(t for t in self.tokens if YEAR_PATTERN.fullmatch(t))
+        # Blocking key: the name without its years
+        self.key = " ".join(t for t in name.split() if t not in self.years)
+        self.day = day
+        self.url = url
+        self.series = series
+        self.acronyms = frozenset(name_acronyms)
+    
+    def to_stored(self) -> list:
+        """Compact JSON form for the dedup index."""
+        return [self.name, self.day, self.url, self.series, sorted(self.acronyms)]
+    
+    @classmethod
+    def from_stored(cls, stored: list) -> "MatchFeatures":
+        features = cls()
+        features._set(*stored)
+        return features
+
+
+# Everything that changes matching results; a stored index built with
+# other settings is discarded
+INDEX_SETTINGS = (
+    f"name={NAME_SIMILARITY};gap={MAX_DATE_GAP_DAYS};dice={MIN_DICE};n={GRAM_SIZE};"
+    f"similarity={'exact' if SIMILARITY_EXACT else DEFAULT_BACKEND};url={CANONICAL_VERSION};series={SERIES_VERSION};norm={NORMALIZE_VERSION};"
+    f"undated={UNDATED_NAME_SIMILARITY};keys={KEY_RULES_VERSION};series_words={SERIES_MIN_WORDS}"
+)
+
 
-def deduplicate(conferences: list[dict]) -> list[dict]:
+def deduplicate(conferences: list[dict], index: Optional[DedupIndex] = None) -> list[dict]:
     """
     Merge duplicate conferences.
     
+    Clusters are found by `find_clusters` and each one is merged into its
+    highest priority record.
+    """
+    return [_merge_conferences(cluster) for cluster in find_clusters(conferences, index)]
+
+
+def find_clusters(conferences: list[dict], index: Optional[DedupIndex] = None) -> list[list[dict]]:
+    """
+    Group duplicate conferences, highest priority record first in each group.
+    
     Matching criteria:
-    1. Normalized name (80%+ similarity)
-    2. Same start date (within 3 days)
-    3. Similar location (fuzzy match)
+    1. Normalized name (75%+ similarity)
+    2. Same start date (within 7 days)
+    
+    Records from different sources whose canonical URLs are equal are
+    joined first, in one pass over a URL hash index, and are not compared
+    with each other again, and so are records from different sources
+    that name the same series (utils.series). Candidates come from a
+    character n-gram index over normalized names with years removed, so
+    only records whose names look alike are compared; names whose keys
+    differ must also agree word for word (see `_keys_agree`). Matching pairs are joined into clusters with union-find, so
+    A~B and B~C end up together even when A and C differ more, and each
+    cluster is merged once. A join is refused when it would put different
+    years or start dates more than 7 days apart into one cluster.
+    
+    The result does not depend on the input order.
+    
+    Args:
+        conferences: Raw records from all sources
+        index: Optional state from the previous run. Records it already
+            knows rejoin their old cluster and only new or changed records
+            are compared. Updated in place; the caller saves it.
     """
     if not conferences:
         return []
     
-    # Group by normalized name prefix
-    groups: dict[str, list[dict]] = {}
+    # Deterministic order: source priority first, then the record itself
+    ordered = sorted(conferences, key=_record_order)
+    
+    incremental = index is not None and not index.needs_full_rebuild(INDEX_SETTINGS)
+    fingerprints = [record_fingerprint(c) for c in ordered] if index is not None else []
+    stored = [index.lookup(fp) for fp in fingerprints] if incremental else [None] * len(ordered)
+    features = [
+        MatchFeatures.from_stored(entry["features"]) if entry else MatchFeatures(conf)
+        for conf, entry in zip(ordered, stored)
+    ]
+    
+    # Per-cluster years and start date range, kept at each root
+    clusters = UnionFind(len(ordered))
+    years = {i: f.years for i, f in enumerate(features)}
+    spans = {i: (f.day, f.day) if f.day is not None else None for i, f in enumerate(features)}
     
-    for conf in conferences:
-        key = _normalize_name(conf.get("name", ""))[:20]  # First 20 chars
-        if key not in groups:
-            groups[key] = []
-        groups[key].append(conf)
+    def join(i: int, j: int):
+        root_i, root_j = clusters.find(i), clusters.find(j)
+        root = clusters.union(i, j)
+        years[root] = years[root_i] | years[root_j]
+        spans[root] = _join_spans(spans[root_i], spans[root_j])
     
-    result = []
+    # Known records go back into last run's clusters without comparing
+    previous: dict[str, int] = {}
+    for i, entry in enumerate(stored):
+        if entry:
+            first = previous.setdefault(entry["cluster"], i)
+            if first != i:
+                join(first, i)
     
-    for key, group in groups.items():
-        if len(group) == 1:
-            result.append(group[0])
+    # Sources linking to the same page describe the same event, unless one
+    # source links there more than once (a shared landing page such as an
+    # organizer's event list)
+    for members in build_url_index([f.url for f in features]).values():
+        if len(members) < 2 or len({ordered[i].get("source") for i in members}) < len(members):
             continue
-        
-        # Sort by source priority
-        group.sort(key=lambda c: SOURCE_PRIORITY.get(c.get("source", ""), 0), reverse=True)
-        
-        merged = []
-        used = set()
-        
-        for i, conf in enumerate(group):
-            if i in used:
-                continue
-            
-            # Find duplicates
-            duplicates = [conf]
-            for j, other in enumerate(group[i+1:], start=i+1):
-                if j in used:
+        for j in members[1:]:
+            root_first, root_j = clusters.find(members[0]), clusters.find(j)
+            if root_first != root_j and _clusters_compatible(years[root_first], years[root_j], spans[root_first], spans[root_j]):
+                join(members[0], j)
+    
+    # Different sources naming the same series: join each record to the
+    # first earlier record of another source it is compatible with
+    for members in build_series_index([f.series for f in features]).values():
+        for pos, j in enumerate(members[1:], 1):
+            for i in members[:pos]:
+                if ordered[i].get("source") == ordered[j].get("source"):
                     continue
-                if _is_duplicate(conf, other):
-                    duplicates.append(other)
-                    used.add(j)
-            
-            # Merge duplicates into the highest priority one
-            merged_conf = _merge_conferences(duplicates)
-            merged.append(merged_conf)
-        
-        result.extend(merged)
+                root_i, root_j = clusters.find(i), clusters.find(j)
+                if root_i == root_j:
+                    break
+                if not _series_match(features[i], features[j]):
+                    continue
+                if _clusters_compatible(years[root_i], years[root_j], spans[root_i], spans[root_j]):
+                    join(i, j)
+                    break
     
-    return result
+    # Same normalized name and start date: duplicates without comparing.
+    # The first record of each such group stands in for it below.
+    representatives: dict[tuple, int] = {}
+    for i, f in enumerate(features):
+        first = representatives.setdefault((f.name, f.day), i)
+        if first != i:
+            join(first, i)
+    
+    # Records sharing a key are always candidates; distinct keys are
+    # compared only when the n-gram index pairs them up
+    by_key: dict[str, list[int]] = {}
+    for i in representatives.values():
+        by_key.setdefault(features[i].key, []).append(i)
+    unique_keys = list(by_key)
+    
+    if incremental:
+        pairs = _new_record_pairs(by_key, unique_keys, stored)
+    else:
+        pairs = []
+        for members in by_key.values():
+            pairs.extend(combinations(members, 2))
+        for a, b in candidate_pairs(unique_keys):
+            pairs.extend(
+                (min(i, j), max(i, j))
+                for i in by_key[unique_keys[a]]
+                for j in by_key[unique_keys[b]]
+            )
+    
+    # Score each record against all of its candidates in one batch
+    for i, group in groupby(sorted(pairs), key=itemgetter(0)):
+        others = [j for _, j in group if clusters.find(j) != clusters.find(i)]
+        matches = _match_many(features[i], [features[j] for j in others])
+        for j, is_match in zip(others, matches):
+            if not is_match:
+                continue
+            root_i, root_j = clusters.find(i), clusters.find(j)
+            if root_i == root_j:
+                continue
+            if not _clusters_compatible(years[root_i], years[root_j], spans[root_i], spans[root_j]):
+                continue
+            join(i, j)
+    
+    groups = clusters.groups()
+    
+    if index is not None:
+        # A cluster is identified by its highest priority member
+        entries = {}
+        for members in groups:
+            cluster_id = fingerprints[members[0]]
+            for i in members:
+                entries[fingerprints[i]] = {"cluster": cluster_id, "features": features[i].to_stored()}
+        index.replace(entries, INDEX_SETTINGS, full_rebuild=not incremental)
+    
+    return [[ordered[i] for i in members] for members in groups]
+
+
+def _new_record_pairs(by_key: dict[str, list[int]], unique_keys: list[str], stored: list) -> set[tuple[int, int]]:
+    """Candidate pairs that involve at least one record the index didn't know."""
+    new_keys = [k for k, key in enumerate(unique_keys) if any(not stored[i] for i in by_key[key])]
+    pairs = set()
+    
+    def add(key: str, other_key: str):
+        for i in by_key[key]:
+            if not stored[i]:
+                pairs.update((min(i, j), max(i, j)) for j in by_key[other_key] if j != i)
+    
+    for k in new_keys:
+        add(unique_keys[k], unique_keys[k])
+    for k, other in query_pairs(new_keys, unique_keys):
+        add(unique_keys[k], unique_keys[other])
+    
+    return pairs
+
+
+def _record_order(conf: dict) -> tuple:
+    """Sort key: highest priority first, ties broken by the record's fields."""
+    return (
+        -SOURCE_PRIORITY.get(conf.get("source", ""), 0),
+        conf.get("name") or "",
+        conf.get("startDate") or "",
+        conf.get("url") or "",
+        conf.get("source") or "",
+    )
+
+
+def _clusters_compatible(years1: frozenset, years2: frozenset, span1, span2) -> bool:
+    """Whether two clusters may be joined without mixing editions."""
+    if years1 and years2 and not (years1 & years2):
+        return False  # "X 2025" vs "X 2026" are different editions
+    if span1 and span2:
+        low, high = _join_spans(span1, span2)
+        if high - low > MAX_DATE_GAP_DAYS:
+            return False
+    return True
+
+
+def _join_spans(span1, span2):
+    """Smallest (first, last) start-date range covering both spans."""
+    if not span1 or not span2:
+        return span1 or span2
+    return min(span1[0], span2[0]), max(span1[1], span2[1])
+
+
+@lru_cache(maxsize=65536)
+def _parse_date(value: Optional[str]) -> Optional[int]:
+    """YYYY-MM-DD as a day ordinal, or None if missing or unparseable."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").toordinal()
+    except (TypeError, ValueError):
+        return None
 
 
 def _normalize_name(name: str) -> str:
-    """Normalize conference name for comparison."""
-    if not name:
-        return ""
-    # Lowercase, remove special chars, collapse whitespace
-    name = name.lower()
-    name = re.sub(r"[^a-z0-9\s]", "", name)
-    name = re.sub(r"\s+", " ", name).strip()
-    return name
+    """Normalize conference name for comparison (see utils.text_normalize)."""
+    return normalize_name(name)
 
 
-def _is_duplicate(conf1: dict, conf2: dict) -> bool:
-    """Check if two conferences are duplicates."""
-    name1 = _normalize_name(conf1.get("name", ""))
-    name2 = _normalize_name(conf2.get("name", ""))
+def _match_many(features: MatchFeatures, others: list[MatchFeatures]) -> list[bool]:
+    """Check one record against several others, scoring names in one batch."""
+    result = [False] * len(others)
+    # threshold -> (positions, names) to score against it
+    batches: dict[float, tuple[list[int], list[str]]] = {}
     
-    # Name similarity check
-    similarity = SequenceMatcher(None, name1, name2).ratio()
-    if similarity < 0.75:
-        return False
+    for k, other in enumerate(others):
+        # Date check (if available)
+        if features.day is not None and other.day is not None and abs(features.day - other.day) > MAX_DATE_GAP_DAYS:
+            continue
+        if features.name == other.name:
+            result[k] = True
+            continue
+        threshold = NAME_SIMILARITY
+        if features.key != other.key:
+            if not _keys_agree(features, other):
+                continue
+            if features.day is None and other.day is None:
+                threshold = UNDATED_NAME_SIMILARITY
+        # The ratio can't exceed 2*min/(len1+len2), which rules out most
+        # pairs without scoring them
+        len1, len2 = len(features.name), len(other.name)
+        if 2 * min(len1, len2) < threshold * (len1 + len2):
+            continue
+        positions, names = batches.setdefault(threshold, ([], []))
+        positions.append(k)
+        names.append(other.name)
     
-    # Date check (if available)
-    date1 = conf1.get("startDate")
-    date2 = conf2.get("startDate")
-    if date1 and date2:
-        if abs(_date_diff(date1, date2)) > 7:  # More than 7 days apart
-            return False
+    # Name similarity check
+    for threshold, (positions, names) in batches.items():
+        for k, similar in zip(positions, similar_many(features.name, names, threshold, exact=SIMILARITY_EXACT)):
+            result[k] = similar
+    return result
+
+
+def _series_match(f1: MatchFeatures, f2: MatchFeatures) -> bool:
+    """
+    Whether two records with the same series key are the same series.
     
-    return True
+    Their acronyms must agree. The shared key then has to be specific
+    enough on its own, or both names must give the same acronym, or the
+    names have to match as usual.
+    """
+    if not _acronyms_agree(f1, f2):
+        return False
+    if len(f1.series.split()) >= SERIES_MIN_WORDS or (f1.acronyms and f1.acronyms == f2.acronyms):
+        return True
+    return _match_many(f1, [f2])[0]
 
 
-def _date_diff(date1: str, date2: str) -> int:
-    """Calculate difference in days between two date strings."""
-    from datetime import datetime
-    try:
-        d1 = datetime.strptime(date1, "%Y-%m-%d")
-        d2 = datetime.strptime(date2, "%Y-%m-%d")
-        return abs((d1 - d2).days)
-    except:
-        return 0
+def _acronyms_agree(f1: MatchFeatures, f2: MatchFeatures) -> bool:
+    """False when both names give acronyms and neither set contains the other."""
+    a1, a2 = f1.acronyms, f2.acronyms
+    return not a1 or not a2 or a1 <= a2 or a2 <= a1
+
+
+def _keys_agree(f1: MatchFeatures, f2: MatchFeatures) -> bool:
+    """
+    Whether two different blocking keys can still name the same event.
+    
+    Their acronyms must agree, and the keys must differ only in spacing or
+    word order ("zurichjs conf" / "zurich js conf"), or one key's words
+    must all appear in the other, which has at least two ("acm conference
+    on ... security" / "annual acm conference on ... security ccs"). A
+    different word on each side ("global azure milano" / "global azure
+    torino", "xtremej" / "xtremejs") means a different event.
+    """
+    if not _acronyms_agree(f1, f2):
+        return False
+    words1, words2 = f1.key.split(), f2.key.split()
+    if sorted("".join(words1)) == sorted("".join(words2)):
+        return True
+    shorter, longer = sorted((set(words1), set(words2)), key=len)
+    return len(shorter) >= 2 and shorter <= longer
 
 
 def _merge_conferences(duplicates: list[dict]) -> dict:
-    """Merge multiple duplicate conferences into one."""
+    """Merge multiple duplicate conferences into one (see utils.merge)."""
     if len(duplicates) == 1:
         return duplicates[0]
-    
-    # Start with highest priority
-    duplicates.sort(key=lambda c: SOURCE_PRIORITY.get(c.get("source", ""), 0), reverse=True)
-    base = duplicates[0].copy()
-    
-    # Fill in missing fields from other sources
-    for dup in duplicates[1:]:
-        if not base.get("startDate") and dup.get("startDate"):
-            base["startDate"] = dup["startDate"]
-        if not base.get("endDate") and dup.get("endDate"):
-            base["endDate"] = dup["endDate"]
-        if not base.get("cfp") and dup.get("cfp"):
-            base["cfp"] = dup["cfp"]
-        if not base.get("location", {}).get("country") and dup.get("location", {}).get("country"):
-            base["location"]["country"] = dup["location"]["country"]
-        if not base.get("twitter") and dup.get("twitter"):
-            base["twitter"] = dup["twitter"]
-    
-    # Track merged sources
-    base["sources"] = list(set(d.get("source", "") for d in duplicates if d.get("source")))
-    
-    return base
+    return merge_records(duplicates, priority=lambda c: SOURCE_PRIORITY.get(c.get("source", ""), 0))
 
 
 if __name__ == "__main__":
@@ -4,7 +4,15 @@ Domain Classifier Module
 Classifies conferences into domains and sub-domains.
 """
 
-import re
+import hashlib
+import json
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Optional
+
+from utils.keyword_automaton import KeywordAutomaton
+from utils.tag_extractor import TagExtractor
 
 
 DOMAIN_KEYWORDS = {
@@ -50,6 +58,32 @@ DOMAIN_KEYWORDS = {
     ],
 }
 
+# All of DOMAIN_KEYWORDS, matched in one pass per text
+DOMAIN_AUTOMATON = KeywordAutomaton(DOMAIN_KEYWORDS)
+
+TECH_TAGS = [
+    "python", "javascript", "typescript", "java", "kotlin", "swift",
+    "rust", "go", "golang", "ruby", "php", "scala", "elixir",
+    "react", "vue", "angular", "svelte", "next.js", "nuxt",
+    "kubernetes", "docker", "terraform", "ansible",
+    "aws", "azure", "gcp", "cloudflare",
+    "postgres", "mysql", "mongodb", "redis", "elasticsearch",
+    "graphql", "rest", "grpc",
+    "agile", "scrum", "kanban",
+]
+
+# Whole-word TECH_TAGS matches, in list order, max 5 tags
+TAG_EXTRACTOR = TagExtractor(TECH_TAGS, limit=5)
+
+# Bump when classify() or extract_tags() change behavior
+CLASSIFIER_VERSION = 1
+
+# Changes whenever the classifier or its keyword tables do, so stored
+# results (utils.classification_cache) are thrown away
+TABLES_VERSION = hashlib.sha1(
+    json.dumps([CLASSIFIER_VERSION, DOMAIN_KEYWORDS, TECH_TAGS], sort_keys=True).encode()
+).hexdigest()[:12]
+
 
 def classify(name: str, tags: list[str] = None) -> tuple[str, list[str]]:
     """
@@ -58,15 +92,56 @@ def classify(name: str, tags: list[str] = None) -> tuple[str, list[str]]:
     Returns:
         (primary_domain, list_of_sub_domains)
     """
-    text = (name + " " + " ".join(tags or [])).lower()
+    primary, sub_domains = _classify_text((name + " " + " ".join(tags or [])).lower())
+    return primary, list(sub_domains)
+
+
+@lru_cache(maxsize=65536)
+def _classify_text(text: str) -> tuple[str, tuple[str, ...]]:
+    # (domain, number of its keywords in text), in DOMAIN_KEYWORDS order
+    primary, sub_domains = _rank(list(DOMAIN_AUTOMATON.scores(text).items()))
+    return primary, tuple(sub_domains)
+
+
+def classify_many(names: list[str], tags: Optional[list[list[str]]] = None) -> list[tuple[str, list[str]]]:
+    """
+    classify() for a whole dataset at once.
+    
+    All texts are scanned in one automaton pass, giving the keywords found
+    in each. Names share few distinct keyword combinations, so each one is
+    scored and ranked once.
     
-    matches = []
+    Args:
+        names: Conference names
+        tags: Tags of each conference, parallel to names
+    """
+    if tags:
+        texts = [(name + " " + " ".join(t or [])).lower() for name, t in zip(names, tags)]
+    else:
+        texts = [(name + " ").lower() for name in names]
+    docs, keyword_ids = DOMAIN_AUTOMATON.incidence(texts)
     
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in text)
-        if score > 0:
-            matches.append((domain, score))
+    found: list[tuple[int, ...]] = [()] * len(texts)
+    for doc, pairs in groupby(zip(docs, keyword_ids), key=itemgetter(0)):
+        found[doc] = tuple(keyword_id for _, keyword_id in pairs)
     
+    rankings = {keyword_ids: _rank_keywords(keyword_ids) for keyword_ids in set(found)}
+    # Every record gets its own sub-domain list
+    return [(primary, sub_domains[:]) for primary, sub_domains in map(rankings.__getitem__, found)]
+
+
+def _rank_keywords(keyword_ids: tuple[int, ...]) -> tuple[str, list[str]]:
+    """_rank() over the domains listing the given automaton keywords."""
+    scores: dict[str, int] = {}
+    for keyword_id in keyword_ids:
+        for domain in DOMAIN_AUTOMATON.listings[keyword_id]:
+            scores[domain] = scores.get(domain, 0) + 1
+    # Back into DOMAIN_KEYWORDS order, which breaks score ties
+    return _rank([(domain, scores[domain]) for domain in DOMAIN_AUTOMATON.groups if domain in scores])
+
+
+def _rank(matches: list[tuple[str, int]]) -> tuple[str, list[str]]:
+    """Primary domain and up to 3 sub-domains from (domain, score) pairs."""
     if not matches:
         return "general", []
     
@@ -81,26 +156,18 @@ def classify(name: str, tags: list[str] = None) -> tuple[str, list[str]]:
 
 def extract_tags(name: str, description: str = "") -> list[str]:
     """Extract technology tags from conference name/description."""
-    text = f"{name} {description}".lower()
-    
-    TECH_TAGS = [
-        "python", "javascript", "typescript", "java", "kotlin", "swift",
-        "rust", "go", "golang", "ruby", "php", "scala", "elixir",
-        "react", "vue", "angular", "svelte", "next.js", "nuxt",
-        "kubernetes", "docker", "terraform", "ansible",
-        "aws", "azure", "gcp", "cloudflare",
-        "postgres", "mysql", "mongodb", "redis", "elasticsearch",
-        "graphql", "rest", "grpc",
-        "agile", "scrum", "kanban",
-    ]
-    
-    found = []
-    for tag in TECH_TAGS:
-        # Word boundary match
-        if re.search(rf"\b{re.escape(tag)}\b", text):
-            found.append(tag)
-    
-    return found[:5]  # Max 5 tags
+    return list(_extract_tags_text(f"{name} {description}".lower()))
+
+
+@lru_cache(maxsize=65536)
+def _extract_tags_text(text: str) -> tuple[str, ...]:
+    return tuple(TAG_EXTRACTOR.extract(text))
+
+
+def extract_tags_many(names: list[str], descriptions: Optional[list[str]] = None) -> list[list[str]]:
+    """extract_tags() for a whole dataset, in one regex pass."""
+    descriptions = descriptions or [""] * len(names)
+    return TAG_EXTRACTOR.extract_many([f"{name} {description}".lower() for name, description in zip(names, descriptions)])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+"""
+Concurrent Fetch Module
+
+Runs every source's fetch() at the same time, each with its own wall-clock
+deadline. Sources that loop over pages can call `deadline_reached()` and
+return what they have collected so far instead of running over budget.
+"""
+
+import contextvars
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+# Default time budget per source (seconds)
+DEFAULT_DEADLINE = 240
+
+# Extra time a source gets after its deadline to wrap up and return
+# partial results before it is abandoned
+GRACE_PERIOD = 30
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "source_deadline", default=None
+)
+
+
+@dataclass
+class SourceResult:
+    """Outcome of a single source fetch."""
+    name: str
+    conferences: list[dict] = field(default_factory=list)
+    elapsed: float = 0.0
+    status: str = "ok"  # ok | partial | timeout | error
+    error: Optional[str] = None
+
+
+def deadline_reached() -> bool:
+    """Return True once the calling source has used up its time budget."""
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def time_remaining() -> Optional[float]:
+    """Seconds left in the calling source's budget (None if unbounded)."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def submit_in_context(executor, fn: Callable, *args):
+    """
+    Submit to a thread pool from inside a source, carrying the source's
+    deadline into the worker thread.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def run_sources(sources: list[tuple], default_deadline: float = DEFAULT_DEADLINE) -> list[SourceResult]:
+    """
+    Run source fetchers concurrently.
+
+    Args:
+        sources: List of (name, fetch_fn) or (name, fetch_fn, deadline_seconds)
+        default_deadline: Deadline used when a source doesn't set its own
+
+    Returns:
+        SourceResult per source, in the same order as `sources`
+    """
+    start = time.monotonic()
+    results = []
+    threads = []
+
+    for entry in sources:
+        name, fetch_fn = entry[0], entry[1]
+        deadline = entry[2] if len(entry) > 2 else default_deadline
+
+        result = SourceResult(name=name)
+        thread = threading.Thread(
+            target=_run_one,
+            args=(fetch_fn, result, start + deadline),
+            name=f"fetch-{name}",
+            daemon=True,  # Abandoned sources must not block interpreter exit
+        )
+        thread.start()
+        results.append(result)
+        threads.append((thread, start + deadline + GRACE_PERIOD))
+
+    for (thread, hard_deadline), result in zip(threads, results):
+        thread.join(max(0.0, hard_deadline - time.monotonic()))
+        if thread.is_alive():
+            result.status = "timeout"
+            result.elapsed = time.monotonic() - start
+            result.conferences = []
+
+    return results
+
+
+def _run_one(fetch_fn: Callable[[], list[dict]], result: SourceResult, deadline: float):
+    """Thread body: run one fetch under its deadline and record the outcome."""
+    _deadline.set(deadline)
+    began = time.monotonic()
+
+    try:
+        conferences = fetch_fn() or []
+        status = "partial" if time.monotonic() >= deadline else "ok"
+        error = None
+    except Exception as e:
+        conferences = []
+        status = "error"
+        error = str(e)
+
+    # Once the runner has given up on us, leave the result alone
+    if result.status == "timeout":
+        return
+
+    result.conferences = conferences
+    result.status = status
+    result.error = error
+    result.elapsed = time.monotonic() - began
+
+
+def format_summary(results: list[SourceResult]) -> list[str]:
+    """Format per-source latency lines for the run summary."""
+    lines = []
+    for r in sorted(results, key=lambda r: r.elapsed, reverse=True):
+        line = f"  {r.name:<20} {r.elapsed:7.1f}s  {len(r.conferences):5d} conferences  [{r.status}]"
+        if r.error:
+            line += f" {r.error}"
+        lines.append(line)
+    return lines
@@ -3,10 +3,19 @@ Geocoder Module
 
 Convert location strings to lat/lng coordinates for world map.
 Uses a static mapping for common cities to avoid API dependencies.
+
+Names are matched by whole words after Unicode folding ("Kraków" is
+"krakow"), through a hash index over runs of words, so a lookup costs
+the same however many places the tables hold, and "rome" no longer
+matches inside "jerome".
 """
 
+import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
+from utils.text_normalize import fold
+
 # Static city coordinates (expand as needed)
 CITY_COORDS = {
     # Europe
@@ -113,35 +122,83 @@ COUNTRY_COORDS = {
 }
 
 
-def geocode(city: str, country: str) -> Optional[Tuple[float, float]]:
+# Dropped inside words ("U.S.A." is "usa"); any other punctuation separates words
+JOINING_MARKS = re.compile(r"[.'’]")
+WORD = re.compile(r"[^\W_]+")
+
+
+def _words(text: str) -> tuple[str, ...]:
+    """Folded words of a place name: "Paris-Châtillon" -> ("paris", "chatillon")."""
+    return tuple(WORD.findall(JOINING_MARKS.sub("", fold(text))))
+
+
+class PlaceIndex:
     """
-    Get lat/lng coordinates for a location.
+    Word index over the names of a {name: coords} table.
     
-    Returns:
-        (lat, lng) tuple or None if not found
-    """
-    city_lower = city.lower().strip() if city else ""
-    country_lower = country.lower().strip() if country else ""
+    A query matches a place when the place's words appear, in order and
+    next to each other, among the query's words ("san francisco" in
+    "san francisco ca"), or, with `contained=True`, when the query's words
+    appear that way within the place's ("vegas" in "las vegas"). When
+    several places match, the one listed first in the table wins.
     
-    # Try city first
-    if city_lower in CITY_COORDS:
-        return CITY_COORDS[city_lower]
+    Every lookup is a handful of dict probes: one per query word and
+    place name length, plus one for the whole query.
+    """
     
-    # Try partial city match
-    for known_city, coords in CITY_COORDS.items():
-        if known_city in city_lower or city_lower in known_city:
-            return coords
+    def __init__(self, places: dict[str, Tuple[float, float]]):
+        # place words -> rank of the first place with exactly those words
+        self.names: dict[tuple[str, ...], int] = {}
+        # any run of a place's words -> rank of the first place containing it
+        self.parts: dict[tuple[str, ...], int] = {}
+        self.coords: list[Tuple[float, float]] = []
+        for rank, (name, coords) in enumerate(places.items()):
+            self.coords.append(coords)
+            words = _words(name)
+            self.names.setdefault(words, rank)
+            for start in range(len(words)):
+                for end in range(start + 1, len(words) + 1):
+                    self.parts.setdefault(words[start:end], rank)
+        self.names.pop((), None)
+        self.lengths = sorted({len(words) for words in self.names})
     
-    # Fall back to country
-    if country_lower in COUNTRY_COORDS:
-        return COUNTRY_COORDS[country_lower]
+    def lookup(self, text: str, contained: bool = False) -> Optional[Tuple[float, float]]:
+        """Coordinates of the best place named in `text`, or None."""
+        query = _words(text)
+        if not query:
+            return None
+        if query in self.names:
+            return self.coords[self.names[query]]
+        
+        # Places named somewhere in the query
+        ranks = [
+            self.names[query[start:start + length]]
+            for length in self.lengths
+            for start in range(len(query) - length + 1)
+            if query[start:start + length] in self.names
+        ]
+        # Places whose name contains the whole query
+        if contained and query in self.parts:
+            ranks.append(self.parts[query])
+        return self.coords[min(ranks)] if ranks else None
+
+
+CITY_INDEX = PlaceIndex(CITY_COORDS)
+COUNTRY_INDEX = PlaceIndex(COUNTRY_COORDS)
+
+
+@lru_cache(maxsize=65536)
+def geocode(city: str, country: str) -> Optional[Tuple[float, float]]:
+    """
+    Get lat/lng coordinates for a location.
     
-    # Try partial country match
-    for known_country, coords in COUNTRY_COORDS.items():
-        if known_country in country_lower:
-            return coords
+    Tries the city (exact, then partial), then the country. The indexes
+    are built from CITY_COORDS and COUNTRY_COORDS at import.
     
-    return None
+    Returns:
+        (lat, lng) tuple or None if not found
+    """
+    return CITY_INDEX.lookup(city or "", contained=True) or COUNTRY_INDEX.lookup(country or "")
 
 
 if __name__ == "__main__":
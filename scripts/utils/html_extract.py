@@ -0,0 +1,189 @@
+"""
+HTML Extract Module
+
+Fast link and table-row extraction for listing pages (WikiCFP, Papercall).
+Instead of building a full BeautifulSoup tree, only the anchors whose href
+matches a pattern are collected, along with the cell texts of the table
+row that contains them. Uses lxml when installed, otherwise a streaming
+html.parser handler from the standard library.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Optional
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+
+# "lxml" or "python"; CONFSCOUT_HTML_ENGINE overrides the automatic choice
+DEFAULT_ENGINE = os.environ.get("CONFSCOUT_HTML_ENGINE") or ("lxml" if HAS_LXML else "python")
+
+
+@dataclass
+class Link:
+    """A matching anchor and, optionally, the cells of its enclosing <tr>."""
+    href: str
+    text: str
+    row_cells: Optional[list[str]] = None
+
+
+def extract_links(html: str, href_pattern: re.Pattern, separator: str = "",
+                  with_rows: bool = False, engine: Optional[str] = None) -> list[Link]:
+    """
+    Find anchors whose href matches `href_pattern` (re.search semantics).
+
+    Text is built like BeautifulSoup's get_text(separator, strip=True):
+    each text node is stripped, empty ones dropped, the rest joined.
+
+    Args:
+        html: Page source
+        href_pattern: Compiled regex tested against each href
+        separator: Joiner for the anchor's text nodes
+        with_rows: Also collect td texts of the nearest enclosing <tr>
+        engine: "lxml" or "python" (defaults to DEFAULT_ENGINE)
+    """
+    engine = engine or DEFAULT_ENGINE
+    if engine == "lxml":
+        if not HAS_LXML:
+            raise ImportError("lxml is not installed")
+        return _extract_lxml(html, href_pattern, separator, with_rows)
+    return _extract_python(html, href_pattern, separator, with_rows)
+
+
+def _join_text(pieces, separator: str) -> str:
+    return separator.join(p for p in (s.strip() for s in pieces) if p)
+
+
+def _extract_lxml(html: str, href_pattern: re.Pattern, separator: str, with_rows: bool) -> list[Link]:
+    if not html.strip():
+        return []
+    root = lxml.html.fromstring(html)
+    links = []
+
+    for a in root.iter("a"):
+        href = a.get("href")
+        if href is None or not href_pattern.search(href):
+            continue
+
+        row_cells = None
+        if with_rows:
+            tr = next(a.iterancestors("tr"), None)
+            if tr is not None:
+                row_cells = [_join_text(td.itertext(), "") for td in tr.iter("td")]
+
+        links.append(Link(href=href, text=_join_text(a.itertext(), separator), row_cells=row_cells))
+
+    return links
+
+
+def _extract_python(html: str, href_pattern: re.Pattern, separator: str, with_rows: bool) -> list[Link]:
+    parser = _LinkRowParser(href_pattern, with_rows)
+    parser.feed(html)
+    parser.close()
+    return [
+        Link(
+            href=href,
+            text=_join_text(pieces, separator),
+            row_cells=[_join_text(cell, "") for cell in row] if row is not None else None,
+        )
+        for href, pieces, row in parser.links
+    ]
+
+
+# Elements that never have content or an end tag
+VOID_TAGS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+))
+
+
+class _LinkRowParser(HTMLParser):
+    """
+    Streaming handler that keeps only the state needed for matching links:
+    the stack of open elements, with text buffers on the matching <a> and
+    on <tr>/<td> elements. Cell text is buffered per open row and dropped
+    when a row closes without a matching link.
+
+    Open elements are closed as an HTML parser would: an end tag closes
+    everything opened after its element (so </table> ends unclosed rows
+    and cells), a new <tr> or <td>/<th> implicitly ends the previous row
+    or cell of the same table, and a new <a> or <table> ends an <a> left
+    open in the same cell.
+    """
+
+    def __init__(self, href_pattern: re.Pattern, with_rows: bool):
+        super().__init__(convert_charrefs=True)
+        self.href_pattern = href_pattern
+        self.with_rows = with_rows
+
+        self.links: list[tuple[str, list[str], Optional[list[list[str]]]]] = []
+        # Open elements: (tag, text pieces of a matching <a> or a <td> /
+        # cells of a <tr>, else None)
+        self._open: list[tuple[str, Optional[list]]] = []
+        # Text pieces of the open matching anchors and cells
+        self._collecting: list[list[str]] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        if tag == "tr":
+            self._close_implied(("tr",), ("table",))
+        elif tag in ("td", "th"):
+            self._close_implied(("td", "th"), ("tr", "table"))
+        if tag in ("a", "table"):
+            self._close_implied(("a",), ("td", "th"))
+
+        content = None
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href is not None and self.href_pattern.search(href):
+                content = []
+                row = None
+                if self.with_rows:
+                    row = next((cells for t, cells in reversed(self._open) if t == "tr"), None)
+                self.links.append((href, content, row))
+                self._collecting.append(content)
+        elif self.with_rows and tag == "tr":
+            content = []
+        elif self.with_rows and tag == "td":
+            # find_all("td") on a row is recursive, so every open row sees it
+            content = []
+            for t, cells in self._open:
+                if t == "tr":
+                    cells.append(content)
+            self._collecting.append(content)
+        self._open.append((tag, content))
+
+    def handle_endtag(self, tag):
+        for i in range(len(self._open) - 1, -1, -1):
+            if self._open[i][0] == tag:
+                self._close(i)
+                return
+
+    def handle_data(self, data):
+        for pieces in self._collecting:
+            pieces.append(data)
+
+    def _close_implied(self, tags: tuple, boundaries: tuple):
+        """Close the innermost open element in `tags`, unless a boundary element is opened after it."""
+        for i in range(len(self._open) - 1, -1, -1):
+            tag = self._open[i][0]
+            if tag in tags:
+                self._close(i)
+                return
+            if tag in boundaries:
+                return
+
+    def _close(self, i: int):
+        """Close the open element at stack position i and everything inside it."""
+        # Buffers were pushed in stack order, so theirs are the last ones
+        closed = sum(1 for tag, content in self._open[i:] if content is not None and tag != "tr")
+        if closed:
+            del self._collecting[-closed:]
+        del self._open[i:]
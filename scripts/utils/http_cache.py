@@ -0,0 +1,200 @@
+"""
+HTTP Cache Module
+
+Persistent, size-capped, gzip-compressed response cache used by the shared
+HTTP client. Entries are revalidated with conditional GETs (ETag /
+Last-Modified), so unchanged remote files are served from disk after a 304.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from utils.paths import CACHE_DIR
+
+
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+
+# Total compressed size kept on disk before least-recently-used entries go
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+
+# Response headers persisted alongside the body
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and its metadata."""
+    url: str
+    body: bytes
+    headers: dict
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def validators(self) -> dict:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class HTTPCache:
+    """
+    On-disk response cache.
+
+    Each entry is two files named after a hash of the URL: `<key>.json`
+    (metadata) and `<key>.gz` (compressed body). Hits touch the body file,
+    so eviction removes the entries with the oldest modification time.
+    """
+
+    def __init__(self, directory: Path = HTTP_CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+    def load(self, url: str, with_body: bool = True) -> Optional[CacheEntry]:
+        """
+        Return the cached entry for a URL, or None on a miss.
+
+        With `with_body=False` only the metadata is read; stream the body
+        with iter_body().
+        """
+        key = self.key(url)
+        meta_path = self.directory / f"{key}.json"
+        body_path = self.directory / f"{key}.gz"
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if with_body:
+                with gzip.open(body_path, "rb") as f:
+                    body = f.read()
+            else:
+                body = b""
+                if not body_path.exists():
+                    return None
+        except (OSError, ValueError, EOFError):
+            return None
+
+        # A hash collision would serve the wrong document
+        if meta.get("url") != url:
+            return None
+
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+        return CacheEntry(url=url, body=body, headers=meta.get("headers", {}), stored_at=meta.get("stored_at", 0))
+
+    def iter_body(self, url: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield a cached body in decompressed chunks."""
+        with gzip.open(self.directory / f"{self.key(url)}.gz", "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def store(self, url: str, body: bytes, headers) -> CacheEntry:
+        """Write a response body to the cache and evict if over the size cap."""
+        writer = self.open_writer(url, headers)
+        writer.write(body)
+        entry = writer.commit()
+        entry.body = body
+        return entry
+
+    def open_writer(self, url: str, headers) -> "CacheWriter":
+        """Start writing a body chunk by chunk (for streamed downloads)."""
+        return CacheWriter(self, url, {h: headers[h] for h in STORED_HEADERS if headers.get(h)})
+
+    def touch(self, entry: CacheEntry) -> CacheEntry:
+        """Mark an entry as fresh again after a 304 Not Modified."""
+        entry.stored_at = time.time()
+        self._write_meta(entry)
+        return entry
+
+    def _write_meta(self, entry: CacheEntry):
+        key = self.key(entry.url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        meta_path = self.directory / f"{key}.json"
+        tmp_path = meta_path.with_suffix(f".json.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"url": entry.url, "headers": entry.headers, "stored_at": entry.stored_at}, f)
+        os.replace(tmp_path, meta_path)
+
+    def _evict(self):
+        """Remove least-recently-used entries until under max_bytes."""
+        with self._lock:
+            try:
+                bodies = [(p, p.stat()) for p in self.directory.glob("*.gz")]
+            except OSError:
+                return
+
+            total = sum(st.st_size for _, st in bodies)
+            if total <= self.max_bytes:
+                return
+
+            bodies.sort(key=lambda item: item[1].st_mtime)
+            for path, st in bodies:
+                if total <= self.max_bytes:
+                    break
+                for stale in (path, path.with_suffix(".json")):
+                    try:
+                        stale.unlink()
+                    except OSError:
+                        pass
+                total -= st.st_size
+
+
+class CacheWriter:
+    """
+    Compresses a body into a temporary file as chunks arrive. The entry
+    only becomes visible on commit(); abort() discards it.
+    """
+
+    def __init__(self, cache: HTTPCache, url: str, headers: dict):
+        self.cache = cache
+        self.url = url
+        self.headers = headers
+
+        cache.directory.mkdir(parents=True, exist_ok=True)
+        self.body_path = cache.directory / f"{cache.key(url)}.gz"
+        self.tmp_path = self.body_path.with_suffix(f".gz.{threading.get_ident()}.tmp")
+        self._file = gzip.open(self.tmp_path, "wb", compresslevel=6)
+
+    def write(self, chunk: bytes):
+        self._file.write(chunk)
+
+    def commit(self) -> CacheEntry:
+        self._file.close()
+        os.replace(self.tmp_path, self.body_path)
+
+        entry = CacheEntry(url=self.url, body=b"", headers=self.headers, stored_at=time.time())
+        self.cache._write_meta(entry)
+        self.cache._evict()
+        return entry
+
+    def abort(self):
+        self._file.close()
+        try:
+            self.tmp_path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,252 @@
+"""
+HTTP Client Module
+
+Shared HTTP session for every source module. Keeps TCP+TLS connections
+alive per host, applies one User-Agent and one timeout policy, paces
+requests with per-host rate limits, and serves responses from the on-disk
+cache when they are fresh or unchanged. In record/replay mode responses
+are also captured to, or served from, utils.http_fixtures.
+"""
+
+import threading
+from typing import Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from utils.fetch_runner import time_remaining
+from utils import http_fixtures
+from utils.http_cache import HTTPCache, CacheEntry
+from utils.rate_limiter import BACKOFF_MAX, HostRateLimiter, RETRY_STATUSES, backoff_delay, parse_retry_after
+
+
+USER_AGENT = "Mozilla/5.0 (compatible; ConfScoutBot/1.0; +https://github.com/mohitmishra786/conf-finder)"
+
+# (connect, read) timeout in seconds
+DEFAULT_TIMEOUT = (10, 30)
+
+# Distinct hosts kept in the pool, and keep-alive connections per host.
+# Sources run concurrently, so a few connections per host are needed.
+POOL_HOSTS = 16
+POOL_CONNECTIONS_PER_HOST = 8
+
+# Retries after a throttled (429/5xx) response or connection failure
+MAX_RETRIES = 3
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+cache = HTTPCache()
+rate_limiter = HostRateLimiter()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def _build_session() -> requests.Session:
+    """Create a session with pooled adapters and default headers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_CONNECTIONS_PER_HOST)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+        timeout=None, max_age: Optional[float] = None, use_cache: bool = True,
+        **kwargs) -> requests.Response:
+    """
+    GET a URL through the shared session and response cache.
+
+    Args:
+        url: URL to fetch
+        params: Query string parameters
+        headers: Extra headers (merged over the session defaults)
+        timeout: Override DEFAULT_TIMEOUT for this request
+        max_age: Serve a cached copy younger than this many seconds
+            without contacting the server
+        use_cache: Set False to bypass the cache entirely
+
+    Returns:
+        requests.Response (raise_for_status() is left to the caller).
+        Responses served from disk have `from_cache = True`.
+    """
+    full_url = requests.Request("GET", url, params=params).prepare().url
+
+    if http_fixtures.is_replaying():
+        return http_fixtures.store.replay(full_url)
+
+    response = _get_live(full_url, headers, timeout, max_age, use_cache, **kwargs)
+
+    if http_fixtures.is_recording():
+        http_fixtures.store.record(full_url, response.status_code, response.headers, response.content)
+
+    return response
+
+
+def _get_live(full_url: str, headers: Optional[dict], timeout, max_age: Optional[float],
+              use_cache: bool, **kwargs) -> requests.Response:
+    """get() against the network and the on-disk cache."""
+    if not use_cache:
+        return _send(full_url, None, headers, timeout, **kwargs)
+
+    entry = cache.load(full_url)
+
+    if entry and max_age is not None and entry.age < max_age:
+        return _cached_response(entry)
+
+    request_headers = dict(headers or {})
+    if entry:
+        request_headers.update(entry.validators())
+
+    response = _send(full_url, None, request_headers, timeout, **kwargs)
+
+    if response.status_code == 304 and entry:
+        return _cached_response(cache.touch(entry))
+
+    if response.status_code == 200 and _is_cacheable(response, max_age):
+        cache.store(full_url, response.content, response.headers)
+
+    return response
+
+
+def stream(url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+           timeout=None, max_age: Optional[float] = None,
+           chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    GET a URL and yield the body in chunks as it downloads.
+
+    Uses the same cache rules as get(); the body is compressed to disk
+    while streaming rather than held in memory. Raises requests.HTTPError
+    for non-2xx responses.
+    """
+    full_url = requests.Request("GET", url, params=params).prepare().url
+
+    if http_fixtures.is_replaying():
+        response = http_fixtures.store.replay(full_url)
+        response.raise_for_status()
+        for i in range(0, len(response.content), chunk_size):
+            yield response.content[i:i + chunk_size]
+        return
+
+    if http_fixtures.is_recording():
+        chunks = []
+        for chunk in _stream_live(full_url, headers, timeout, max_age, chunk_size):
+            chunks.append(chunk)
+            yield chunk
+        http_fixtures.store.record(full_url, 200, {}, b"".join(chunks))
+        return
+
+    yield from _stream_live(full_url, headers, timeout, max_age, chunk_size)
+
+
+def _stream_live(full_url: str, headers: Optional[dict], timeout, max_age: Optional[float],
+                 chunk_size: int) -> Iterator[bytes]:
+    """stream() against the network and the on-disk cache."""
+    entry = cache.load(full_url, with_body=False)
+
+    if entry and max_age is not None and entry.age < max_age:
+        yield from cache.iter_body(full_url, chunk_size)
+        return
+
+    request_headers = dict(headers or {})
+    if entry:
+        request_headers.update(entry.validators())
+
+    with _send(full_url, None, request_headers, timeout, stream=True) as response:
+        if response.status_code == 304 and entry:
+            cache.touch(entry)
+            yield from cache.iter_body(full_url, chunk_size)
+            return
+
+        response.raise_for_status()
+
+        writer = cache.open_writer(full_url, response.headers) if _is_cacheable(response, max_age) else None
+        completed = False
+        try:
+            for chunk in response.iter_content(chunk_size):
+                if writer:
+                    writer.write(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if writer:
+                writer.commit() if completed else writer.abort()
+
+
+def _send(url: str, params: Optional[dict], headers: Optional[dict], timeout, **kwargs) -> requests.Response:
+    """Issue the network request, pacing and retrying per host."""
+    bucket = rate_limiter.bucket(url)
+    attempt = 0
+
+    while True:
+        bucket.acquire()
+        try:
+            response = get_session().get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=timeout or DEFAULT_TIMEOUT,
+                **kwargs,
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            delay = backoff_delay(attempt)
+            if not _can_retry(attempt, delay):
+                raise
+            bucket.throttle(delay)
+            attempt += 1
+            continue
+
+        if response.status_code not in RETRY_STATUSES:
+            bucket.recover()
+            return response
+
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = backoff_delay(attempt)
+        if not _can_retry(attempt, delay):
+            return response
+
+        response.close()
+        bucket.throttle(delay)
+        attempt += 1
+
+
+def _can_retry(attempt: int, delay: float) -> bool:
+    """
+    Retry only within MAX_RETRIES and the calling source's deadline, and
+    give up when the server asks to wait longer than BACKOFF_MAX.
+    """
+    if attempt >= MAX_RETRIES or delay > BACKOFF_MAX:
+        return False
+    remaining = time_remaining()
+    return remaining is None or delay < remaining
+
+
+def _is_cacheable(response: requests.Response, max_age: Optional[float]) -> bool:
+    """Worth storing if it can be revalidated or the caller accepts stale copies."""
+    if "no-store" in response.headers.get("Cache-Control", ""):
+        return False
+    return bool(max_age or response.headers.get("ETag") or response.headers.get("Last-Modified"))
+
+
+def _cached_response(entry: CacheEntry) -> requests.Response:
+    """Build a requests.Response from a cache entry."""
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = entry.url
+    response._content = entry.body
+    response.headers = CaseInsensitiveDict(entry.headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
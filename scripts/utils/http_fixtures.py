@@ -0,0 +1,116 @@
+"""
+HTTP Fixtures Module
+
+Record/replay harness for offline pipeline runs. In record mode every
+response a source receives is saved to a versioned fixture directory; in
+replay mode those responses are served from disk and nothing touches the
+network, so `aggregate_data.py` runs deterministically and stage timings
+can be compared between commits.
+
+    CONFSCOUT_HTTP_MODE=record CONFSCOUT_FIXTURE_DIR=fixtures/http python scripts/aggregate_data.py
+    CONFSCOUT_HTTP_MODE=replay CONFSCOUT_FIXTURE_DIR=fixtures/http python scripts/aggregate_data.py
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.paths import HTTP_MODE, ROOT_DIR
+
+
+# Bump when the on-disk layout changes; each version gets its own directory
+FIXTURE_FORMAT_VERSION = 1
+
+FIXTURE_DIR = Path(os.environ.get("CONFSCOUT_FIXTURE_DIR", ROOT_DIR / "fixtures" / "http"))
+
+# Response headers kept in fixtures
+RECORDED_HEADERS = ("content-type", "etag", "last-modified", "retry-after")
+
+
+class FixtureStore:
+    """
+    Layout:
+        <root>/v<FIXTURE_FORMAT_VERSION>/manifest.json  {url: {"file", "status", "headers"}}
+        <root>/v<FIXTURE_FORMAT_VERSION>/<sha256(url)>.gz
+    """
+
+    def __init__(self, root: Path = FIXTURE_DIR):
+        self.directory = Path(root) / f"v{FIXTURE_FORMAT_VERSION}"
+        self.manifest_path = self.directory / "manifest.json"
+        self._lock = threading.Lock()
+        self._manifest: Optional[dict] = None
+
+    def _load_manifest(self) -> dict:
+        if self._manifest is None:
+            try:
+                with open(self.manifest_path) as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {"formatVersion": FIXTURE_FORMAT_VERSION, "entries": {}}
+        return self._manifest
+
+    def record(self, url: str, status: int, headers, body: bytes):
+        """Save one response and update the manifest."""
+        filename = hashlib.sha256(url.encode()).hexdigest()[:32] + ".gz"
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # mtime=0 keeps re-recorded identical responses byte-identical
+        with open(self.directory / filename, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(body)
+
+        with self._lock:
+            manifest = self._load_manifest()
+            manifest["entries"][url] = {
+                "file": filename,
+                "status": status,
+                "headers": {h: headers[h] for h in RECORDED_HEADERS if headers.get(h)},
+            }
+            manifest["recordedAt"] = datetime.utcnow().isoformat() + "Z"
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+
+    def replay(self, url: str) -> requests.Response:
+        """
+        Serve a recorded response.
+
+        Raises:
+            requests.ConnectionError: If the URL was never recorded, which
+                sources already treat as a failed request
+        """
+        with self._lock:
+            entry = self._load_manifest()["entries"].get(url)
+        if entry is None:
+            raise requests.ConnectionError(f"No recorded fixture for {url}")
+
+        with gzip.open(self.directory / entry["file"], "rb") as f:
+            body = f.read()
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.url = url
+        response._content = body
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+store = FixtureStore()
+
+
+def is_recording() -> bool:
+    return HTTP_MODE == "record"
+
+
+def is_replaying() -> bool:
+    return HTTP_MODE == "replay"
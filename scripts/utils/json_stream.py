@@ -0,0 +1,92 @@
+"""
+JSON Stream Module
+
+Incremental parser for large top-level JSON arrays. Items are decoded as
+soon as their bytes arrive, so memory is bounded by the size of one item
+plus one network chunk rather than the whole document.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_array_items(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array from a stream of byte chunks.
+
+    Raises:
+        ValueError: If the stream is not a JSON array or ends mid-item
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    finished = False
+
+    def skip(text: str, i: int) -> int:
+        while i < len(text) and text[i] in _WHITESPACE:
+            i += 1
+        return i
+
+    chunk_iter = iter(chunks)
+    eof = False
+
+    while not finished:
+        chunk = next(chunk_iter, None)
+        if chunk is None:
+            eof = True
+            buf += utf8.decode(b"", final=True)
+        else:
+            buf += utf8.decode(chunk)
+
+        while True:
+            pos = skip(buf, pos)
+            if pos >= len(buf):
+                break
+
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+
+            if buf[pos] == "]":
+                finished = True
+                break
+            if buf[pos] == ",":
+                pos += 1
+                continue
+
+            try:
+                item, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # Item not complete yet
+
+            # A number may still be growing ("2" of "2.5"): only trust a
+            # scalar once the delimiter after it has arrived
+            if not eof and not isinstance(item, (dict, list)):
+                after = skip(buf, end)
+                if after >= len(buf) or buf[after] not in ",]":
+                    break
+
+            pos = end
+            yield item
+
+        # Drop consumed text so the buffer holds at most one partial item
+        if pos:
+            buf = buf[pos:]
+            pos = 0
+
+        if eof and not finished:
+            raise ValueError("JSON array ended unexpectedly")
+
+    # Drain the source so streaming callers (cache writers, recorders) see
+    # the download complete
+    for _ in chunk_iter:
+        pass
@@ -0,0 +1,176 @@
+"""
+Keyword Automaton Module
+
+Aho-Corasick matcher for the keyword tables used to classify conferences.
+All keywords of a table are compiled once into a single automaton, which
+finds every keyword occurring in a text in one pass over it, instead of
+one substring scan per keyword. Uses the pyahocorasick C extension when
+installed, otherwise an automaton built here in pure Python.
+
+Matching has the same meaning as `keyword in text`: plain substrings,
+overlapping matches included, so "react native" finds both "react" and
+"react native".
+"""
+
+import os
+from collections import deque
+from typing import Optional
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+# "ahocorasick" or "python"; CONFSCOUT_KEYWORD_ENGINE overrides the automatic choice
+DEFAULT_ENGINE = os.environ.get("CONFSCOUT_KEYWORD_ENGINE") or ("ahocorasick" if HAS_AHOCORASICK else "python")
+
+# Joins the texts of a batch; no keyword may contain it
+SEPARATOR = "\x00"
+
+
+def join_texts(texts: list[str]) -> str:
+    """The texts as one string, separated by SEPARATOR (removed from the texts themselves)."""
+    corpus = SEPARATOR.join(texts)
+    if corpus.count(SEPARATOR) != max(len(texts) - 1, 0):
+        corpus = SEPARATOR.join(text.replace(SEPARATOR, " ") for text in texts)
+    return corpus
+
+
+class KeywordAutomaton:
+    """
+    Automaton over the keywords of named groups, e.g. DOMAIN_KEYWORDS.
+
+    A keyword may belong to several groups (and appear in a group more than
+    once); each listing counts toward that group's score.
+    """
+
+    def __init__(self, groups: dict[str, list[str]], engine: Optional[str] = None):
+        self.engine = engine or DEFAULT_ENGINE
+        if self.engine == "ahocorasick" and not HAS_AHOCORASICK:
+            raise ImportError("pyahocorasick is not installed")
+        if self.engine not in ("ahocorasick", "python"):
+            raise ValueError(f"Unknown keyword engine: {self.engine}")
+
+        self.groups = list(groups)
+        self.keywords: list[str] = []
+        keyword_ids: dict[str, int] = {}
+        # keyword id -> group of every listing, in table order
+        self.listings: list[list[str]] = []
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                if keyword not in keyword_ids:
+                    keyword_ids[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self.listings.append([])
+                self.listings[keyword_ids[keyword]].append(group)
+
+        if self.engine == "ahocorasick":
+            self._build_c()
+        else:
+            self._build_python()
+
+    def _build_c(self):
+        self._automaton = ahocorasick.Automaton()
+        for keyword_id, keyword in enumerate(self.keywords):
+            self._automaton.add_word(keyword, keyword_id)
+        if self.keywords:
+            self._automaton.make_automaton()
+
+    def _build_python(self):
+        # Trie of all keywords
+        goto: list[dict[str, int]] = [{}]
+        output: list[list[int]] = [[]]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    output.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            output[state].append(keyword_id)
+
+        # Failure links, breadth first, folded into complete transitions so
+        # matching never has to follow them
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            output[state] = output[state] + output[fail[state]]
+            transitions = dict(delta[fail[state]])
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                transitions[char] = child
+                queue.append(child)
+            delta[state] = transitions
+
+        self._delta = delta
+        self._output = [tuple(ids) for ids in output]
+
+    def _find_ids(self, text: str) -> set[int]:
+        if self.engine == "ahocorasick":
+            if not self.keywords:
+                return set()
+            return {keyword_id for _, keyword_id in self._automaton.iter(text)}
+
+        delta, output = self._delta, self._output
+        found = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def incidence(self, texts: list[str]) -> tuple[list[int], list[int]]:
+        """
+        Which keywords occur in which texts, for a whole batch in one pass:
+        parallel lists of text positions and keyword ids, each distinct
+        (text, keyword) pair once, ordered by text.
+
+        The texts are scanned as one string, joined by a separator no
+        keyword contains, so no match can span two texts.
+        """
+        corpus = join_texts(texts)
+        # dict as an ordered set: matches arrive text by text
+        pairs: dict[tuple[int, int], None] = {}
+        if self.engine == "ahocorasick":
+            if self.keywords and texts:
+                # Matches come in order of their end position
+                doc, next_start = 0, len(texts[0]) + 1
+                for end, keyword_id in self._automaton.iter(corpus):
+                    while end >= next_start:
+                        doc += 1
+                        next_start += len(texts[doc]) + 1
+                    pairs[doc, keyword_id] = None
+        else:
+            delta, output = self._delta, self._output
+            doc = state = 0
+            for char in corpus:
+                if char == SEPARATOR:
+                    doc += 1
+                    state = 0
+                    continue
+                state = delta[state].get(char, 0)
+                if output[state]:
+                    for keyword_id in output[state]:
+                        pairs[doc, keyword_id] = None
+        return [doc for doc, _ in pairs], [keyword_id for _, keyword_id in pairs]
+
+    def find(self, text: str) -> list[str]:
+        """Distinct keywords occurring in `text`, in table order."""
+        return [self.keywords[i] for i in sorted(self._find_ids(text))]
+
+    def scores(self, text: str) -> dict[str, int]:
+        """
+        Per group, how many of its keywords occur in `text`; groups without
+        any are left out. Groups keep the table's order.
+        """
+        counts = dict.fromkeys(self.groups, 0)
+        for keyword_id in self._find_ids(text):
+            for group in self.listings[keyword_id]:
+                counts[group] += 1
+        return {group: count for group, count in counts.items() if count}
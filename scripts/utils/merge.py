@@ -0,0 +1,62 @@
+"""
+Merge Module
+
+Combines a cluster of duplicate records into one. The highest priority
+record is the base; every field it lacks is taken from the highest
+priority duplicate that has it, in a single pass over the cluster.
+
+Merging is copy-on-write: the result shares unchanged values (nested
+dicts included) with the inputs, and a nested dict is copied only when one
+of its keys has to be filled in, so the input records are never modified.
+
+Fields filled from another record are listed in the result's
+"provenance", e.g. {"cfp": "papercall", "location.country": "scraly"}.
+Fields missing from it came from the base record's own source.
+"""
+
+from typing import Callable
+
+
+# Fields filled in from duplicates, in order; "a.b" is key b of dict a
+MERGE_FIELDS = ("startDate", "endDate", "cfp", "location.country", "twitter")
+
+
+def merge_records(records: list[dict], priority: Callable[[dict], int]) -> dict:
+    """
+    Merge duplicate records into a new dict.
+
+    Args:
+        records: The duplicates; not modified
+        priority: Rank of a record; ties keep the input order
+    """
+    ordered = sorted(records, key=priority, reverse=True)
+    base = ordered[0]
+    merged = dict(base)
+    provenance = {}
+
+    for field in MERGE_FIELDS:
+        parent, _, key = field.rpartition(".")
+        if _get(base, parent, key):
+            continue
+        for record in ordered[1:]:
+            value = _get(record, parent, key)
+            if value:
+                if parent:
+                    # Copy the nested dict before writing: it is shared with base
+                    merged[parent] = {**(merged.get(parent) or {}), key: value}
+                else:
+                    merged[key] = value
+                provenance[field] = record.get("source", "")
+                break
+
+    merged["sources"] = sorted({r["source"] for r in ordered if r.get("source")})
+    if provenance:
+        merged["provenance"] = provenance
+    return merged
+
+
+def _get(record: dict, parent: str, key: str):
+    """record[key], or record[parent][key] for a nested field; None if absent."""
+    if parent:
+        record = record.get(parent) or {}
+    return record.get(key)
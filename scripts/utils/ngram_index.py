@@ -0,0 +1,142 @@
+"""
+N-gram Index Module
+
+Character n-gram inverted index for generating near-duplicate candidate
+pairs without comparing every record with every other. Two strings are
+candidates when the Dice overlap of their n-gram sets passes a threshold.
+
+Strings are indexed in order of size, so each one is only checked against
+shorter or equal strings, and postings (kept in that order) skip the ones
+too short to pass. Only a short "prefix" of each string's grams - its
+rarest ones - is indexed, and two sets that overlap enough share at least
+SHARED_PREFIX_GRAMS grams there, so common grams ("con", "ere", ...)
+never produce candidates on their own.
+
+Generic names ("Python Conference London") have no rare grams at all, and
+their postings grow with the input. Postings longer than MAX_POSTING are
+skipped when probing, so such strings pair up through the rarer grams
+they have left; this bounds the work per string at the cost of a few
+missed pairs among very common names.
+"""
+
+import math
+from collections import Counter
+from typing import Iterator, Optional
+
+
+# Character n-gram length
+GRAM_SIZE = 3
+
+# Minimum Dice coefficient (2|A&B| / (|A|+|B|)) over n-gram sets
+MIN_DICE = 0.75
+
+# Grams two sets must share in their prefixes to be compared
+SHARED_PREFIX_GRAMS = 2
+
+# Postings longer than this are skipped when probing (None: never)
+MAX_POSTING: Optional[int] = 100
+
+
+def ngrams(text: str, n: int = GRAM_SIZE) -> frozenset:
+    """Padded character n-grams of a string ("ab" -> {" ab", "ab "})."""
+    padded = f" {text} "
+    if len(padded) < n:
+        return frozenset((padded,))
+    return frozenset(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+def candidate_pairs(texts: list[str], n: int = GRAM_SIZE, min_dice: float = MIN_DICE,
+                    max_posting: Optional[int] = MAX_POSTING) -> Iterator[tuple[int, int]]:
+    """
+    Yield (i, j) pairs with i < j whose strings look like near-duplicates.
+
+    Grams are ordered globally from rarest to most common. For sets x and
+    y with |y| <= |x| and Dice >= t they share at least
+    ceil(|x| * t / (2 - t)) grams, and at least ceil(|y| * t) grams; the
+    first k shared grams then lie within the first |x| - that + k grams of
+    x and the first |y| - that + k grams of y. So x probes with the first
+    and y is indexed with the second, and pairs sharing fewer than k of
+    them are never compared.
+
+    Args:
+        texts: Strings to block (typically normalized names)
+        n: Gram length
+        min_dice: Dice threshold
+        max_posting: Skip grams indexed for more strings than this
+    """
+    t = min_dice
+    gram_sets = [ngrams(text, n) for text in texts]
+    frequency = Counter(gram for grams in gram_sets for gram in grams)
+    rank = {gram: r for r, gram in enumerate(sorted(frequency, key=lambda g: (frequency[g], g)))}
+    ordered = [sorted(rank[gram] for gram in grams) for grams in gram_sets]
+    sizes = [len(grams) for grams in gram_sets]
+
+    postings: dict[int, list[int]] = {}
+    # First posting entry still long enough for the current string
+    starts: dict[int, int] = {}
+
+    for x in sorted(range(len(texts)), key=sizes.__getitem__):
+        size = sizes[x]
+        min_size = size * t / (2 - t)
+        overlap = max(1, math.ceil(size * t / (2 - t) - 1e-9))
+        shared = min(SHARED_PREFIX_GRAMS, overlap)
+
+        # Strings met in one probed posting, and in at least two
+        once, twice = set(), set()
+        for gram in ordered[x][:size - overlap + shared]:
+            posting = postings.get(gram)
+            if posting is None:
+                continue
+            start = starts[gram]
+            while start < len(posting) and sizes[posting[start]] < min_size:
+                start += 1
+            starts[gram] = start
+            if max_posting is not None and len(posting) - start > max_posting:
+                continue
+            found = set(posting[start:] if start else posting)
+            twice |= once & found
+            once |= found
+
+        grams = gram_sets[x]
+        for y in (twice if shared > 1 else once):
+            if 2 * len(grams & gram_sets[y]) >= t * (size + sizes[y]):
+                yield (y, x) if y < x else (x, y)
+
+        overlap = max(1, math.ceil(size * t - 1e-9))
+        for gram in ordered[x][:size - overlap + min(SHARED_PREFIX_GRAMS, overlap)]:
+            if gram in postings:
+                postings[gram].append(x)
+            else:
+                postings[gram] = [x]
+                starts[gram] = 0
+
+
+def query_pairs(queries: list[int], texts: list[str], n: int = GRAM_SIZE, min_dice: float = MIN_DICE) -> Iterator[tuple[int, int]]:
+    """
+    Yield (query, other) id pairs for a few query strings against all texts.
+
+    For incremental runs where only `queries` (ids into `texts`) are new:
+    the queries' grams are indexed and every text is scanned once, which is
+    cheaper than building the prefix index over everything.
+    """
+    postings: dict[str, list[int]] = {}
+    query_sizes = {}
+    for q in queries:
+        grams = ngrams(texts[q], n)
+        query_sizes[q] = len(grams)
+        for gram in grams:
+            postings.setdefault(gram, []).append(q)
+    if not postings:
+        return
+
+    for doc_id, text in enumerate(texts):
+        grams = ngrams(text, n)
+        overlap: dict[int, int] = {}
+        for gram in grams & postings.keys():
+            for q in postings[gram]:
+                overlap[q] = overlap.get(q, 0) + 1
+        size = len(grams)
+        for q, shared in overlap.items():
+            if q != doc_id and 2 * shared >= min_dice * (size + query_sizes[q]):
+                yield q, doc_id
+
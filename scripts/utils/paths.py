@@ -0,0 +1,31 @@
+"""
+Paths Module
+
+Shared filesystem locations for the aggregator.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+
+# "live" (default), "record" or "replay" - see utils.http_fixtures
+HTTP_MODE = os.environ.get("CONFSCOUT_HTTP_MODE", "live").lower()
+
+# Persistent state kept between runs (HTTP cache, crawl state, indexes).
+# The sync workflow restores and saves this directory with actions/cache.
+# Record and replay runs start from empty state so they issue the same
+# requests, unless CONFSCOUT_CACHE_DIR is set explicitly. That state lives
+# in a fresh temporary directory, created by the first write to it and
+# removed when the process exits.
+if "CONFSCOUT_CACHE_DIR" in os.environ:
+    CACHE_DIR = Path(os.environ["CONFSCOUT_CACHE_DIR"])
+elif HTTP_MODE in ("record", "replay"):
+    CACHE_DIR = Path(tempfile.gettempdir()) / f"confscout-state-{os.getpid()}-{os.urandom(4).hex()}"
+    atexit.register(shutil.rmtree, CACHE_DIR, ignore_errors=True)
+else:
+    CACHE_DIR = ROOT_DIR / ".cache"
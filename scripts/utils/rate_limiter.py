@@ -0,0 +1,116 @@
+"""
+Rate Limiter Module
+
+Per-host token buckets shared by every source. When a host answers 429/503
+its rate is cut and all threads wait out the Retry-After or backoff delay;
+the rate then creeps back up as requests succeed.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+# (requests per second, burst) per host
+HOST_LIMITS = {
+    "www.wikicfp.com": (1.0, 3),
+    "wikicfp.com": (1.0, 3),
+    "dblp.org": (2.0, 4),
+    "api.github.com": (2.0, 5),
+    "raw.githubusercontent.com": (10.0, 20),
+    "www.papercall.io": (1.0, 2),
+    "sessionize.com": (8.0, 16),
+}
+DEFAULT_LIMIT = (5.0, 10)
+
+# Adaptive rate: multiply on throttle, add back on success
+THROTTLE_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+MIN_RATE = 0.1
+
+# Exponential backoff
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+RETRY_STATUSES = {429, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket with a pause for throttled hosts."""
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def throttle(self, delay: float):
+        """Server pushed back: slow down and pause everyone for `delay`."""
+        with self._lock:
+            self.rate = max(MIN_RATE, self.rate * THROTTLE_FACTOR)
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+            self.tokens = 0
+
+    def recover(self):
+        """Request succeeded: nudge the rate back toward its maximum."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + RECOVERY_STEP * self.max_rate)
+
+
+class HostRateLimiter:
+    """One token bucket per host, created on first use."""
+
+    def __init__(self, limits: dict = HOST_LIMITS, default: tuple = DEFAULT_LIMIT):
+        self.limits = limits
+        self.default = default
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = (urlsplit(url).hostname or "").lower()
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self.limits.get(host, self.default)
+                self._buckets[host] = TokenBucket(rate, burst)
+            return self._buckets[host]
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt (0-based)."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -0,0 +1,87 @@
+"""
+Conference Series Module
+
+Reduces the name of one edition of a conference to the name of its series,
+so every edition and every source's spelling of it share one key:
+
+    "ACM SIGMOD Conference 2026"            ->  "acm sigmod conference"
+    "26th Annual ACM SIGMOD Conference"     ->  "acm sigmod conference"
+    "ACM SIGMOD Conference (SIGMOD '26)"    ->  "acm sigmod conference"
+    "SIGMOD #26"                            ->  "sigmod"
+
+Years, edition ordinals, "#26"-style numbering, "annual"/"edition" and
+anything in parentheses (usually the acronym) are dropped. Looking a
+series up is then a dict lookup rather than a fuzzy name comparison.
+
+Because the acronym is dropped from the key, acronyms() keeps it apart:
+"Cloud Computing (CloudComp)" and "CLOUD COMPUTING" share a key but not
+an acronym.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+from utils.text_normalize import normalize_name
+
+
+# Bump when series_key() changes, so stored series keys are rebuilt
+SERIES_VERSION = 1
+
+PARENTHESIZED = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+
+# Removed before punctuation is stripped, while "#" and "'" still mark them
+EDITION_MARKS = re.compile(
+    r"#\s*\d+\b"                       # "#26"
+    r"|(?<!\w)'\d{2}\b"                # "'26"
+    r"|\b(?:19|20)\d{2}\b"             # "2026"
+    r"|\b\d+(?:st|nd|rd|th)\b",        # "26th"
+    re.IGNORECASE,
+)
+
+PARENTHESIZED_WORD = re.compile(r"[(\[]\s*([^\W\d_][\w&+-]*)")
+WORD = re.compile(r"[^\W\d_][\w&+-]*")
+
+EDITION_WORDS = {
+    "annual", "edition",
+    "first", "second", "third", "fourth", "fifth",
+    "sixth", "seventh", "eighth", "ninth", "tenth",
+}
+
+
+@lru_cache(maxsize=65536)
+def series_key(name: Optional[str]) -> str:
+    """
+    Series key of a conference name: lowercase words without years,
+    edition numbering or parenthesized text. Returns "" if nothing is left.
+    """
+    if not name:
+        return ""
+    name = PARENTHESIZED.sub(" ", name)
+    name = EDITION_MARKS.sub(" ", name)
+    return " ".join(word for word in normalize_name(name).split() if word not in EDITION_WORDS)
+
+
+def build_series_index(keys: list[str]) -> dict[str, list[int]]:
+    """Map each non-empty series key to the positions it appears at."""
+    index: dict[str, list[int]] = {}
+    for i, key in enumerate(keys):
+        if key:
+            index.setdefault(key, []).append(i)
+    return index
+
+
+@lru_cache(maxsize=65536)
+def acronyms(name: Optional[str]) -> frozenset:
+    """
+    Normalized acronyms in a conference name: the first word of anything in
+    parentheses, and uppercase words ("SIGMOD", "PHP") unless the whole name
+    is uppercase.
+    """
+    if not name:
+        return frozenset()
+    found = PARENTHESIZED_WORD.findall(name)
+    words = [word for word in WORD.findall(PARENTHESIZED.sub(" ", name)) if len(word) > 1]
+    if not all(word.isupper() for word in words):
+        found += [word for word in words if word.isupper()]
+    return frozenset(normalize_name(word) for word in found)
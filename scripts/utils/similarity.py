@@ -0,0 +1,215 @@
+"""
+Similarity Module
+
+String similarity for conference name matching, with pluggable backends:
+
+- "difflib": difflib.SequenceMatcher.ratio(), the reference the dedup
+  thresholds were tuned on. Pure Python, always available.
+- "rapidfuzz" / "levenshtein": normalized InDel similarity from the C
+  extensions of the same names, when installed.
+
+InDel similarity is 2*LCS/(len(a)+len(b)). SequenceMatcher's matching
+blocks form a common subsequence, so its ratio can never be higher. A fast
+backend can therefore reject pairs outright and leave only the survivors
+for difflib ("exact" matching, identical results), or be used on its own
+with a threshold calibrated against difflib ("calibrated" matching).
+
+    python -m utils.similarity   # calibrate on public/data/conferences.json
+"""
+
+import os
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Optional
+
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz, process as rapidfuzz_process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+try:
+    import Levenshtein
+    HAS_LEVENSHTEIN = True
+except ImportError:
+    HAS_LEVENSHTEIN = False
+
+
+# "rapidfuzz", "levenshtein" or "difflib"; CONFSCOUT_SIMILARITY overrides the automatic choice
+DEFAULT_BACKEND = os.environ.get("CONFSCOUT_SIMILARITY") or (
+    "rapidfuzz" if HAS_RAPIDFUZZ else "levenshtein" if HAS_LEVENSHTEIN else "difflib"
+)
+
+# Backend thresholds that best reproduce difflib ratio >= 0.75 on
+# conferences.json name pairs (from calibrate(); see __main__)
+CALIBRATED_THRESHOLDS = {
+    "difflib": 0.75,
+    "rapidfuzz": 0.75,
+    "levenshtein": 0.75,
+}
+
+REFERENCE_THRESHOLD = 0.75
+
+
+def _check_backend(backend: Optional[str]) -> str:
+    backend = backend or DEFAULT_BACKEND
+    if backend == "rapidfuzz" and not HAS_RAPIDFUZZ:
+        raise ImportError("rapidfuzz is not installed")
+    if backend == "levenshtein" and not HAS_LEVENSHTEIN:
+        raise ImportError("Levenshtein is not installed")
+    if backend not in CALIBRATED_THRESHOLDS:
+        raise ValueError(f"Unknown similarity backend: {backend}")
+    return backend
+
+
+def ratio(a: str, b: str, backend: Optional[str] = None) -> float:
+    """Similarity of two strings in [0, 1]."""
+    backend = _check_backend(backend)
+    if backend == "rapidfuzz":
+        return rapidfuzz_fuzz.ratio(a, b, processor=None) / 100
+    if backend == "levenshtein":
+        return Levenshtein.ratio(a, b)
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def ratio_many(query: str, choices: list[str], backend: Optional[str] = None, score_cutoff: float = 0.0) -> list[float]:
+    """
+    Similarity of `query` against each choice, in order.
+
+    Scores below `score_cutoff` may be reported as 0.0; the C backends use
+    the cutoff to stop early.
+    """
+    backend = _check_backend(backend)
+    if backend == "rapidfuzz":
+        scores = [0.0] * len(choices)
+        for _, score, i in rapidfuzz_process.extract(
+            query, choices, scorer=rapidfuzz_fuzz.ratio, processor=None,
+            score_cutoff=score_cutoff * 100, limit=None,
+        ):
+            scores[i] = score / 100
+        return scores
+    if backend == "levenshtein":
+        return [Levenshtein.ratio(query, choice) for choice in choices]
+
+    matcher = SequenceMatcher(None, query)
+    scores = []
+    for choice in choices:
+        matcher.set_seq2(choice)
+        scores.append(matcher.ratio())
+    return scores
+
+
+def similar_many(query: str, choices: list[str], threshold: float = REFERENCE_THRESHOLD,
+                 backend: Optional[str] = None, exact: bool = True) -> list[bool]:
+    """
+    Whether each choice is at least `threshold` similar to `query`, as
+    difflib would decide.
+
+    Args:
+        query: String compared against every choice
+        choices: Candidate strings
+        threshold: difflib ratio threshold
+        backend: Similarity backend (defaults to DEFAULT_BACKEND)
+        exact: With a C backend, confirm its survivors with difflib so the
+            answer is exactly difflib's. With exact=False the backend's score
+            is compared against its calibrated threshold instead; only
+            supported for the reference threshold.
+    """
+    backend = _check_backend(backend)
+    if backend == "difflib":
+        return [score >= threshold for score in ratio_many(query, choices, backend)]
+
+    if not exact:
+        if threshold != REFERENCE_THRESHOLD:
+            raise ValueError(f"Calibrated matching is only available at {REFERENCE_THRESHOLD}")
+        cutoff = CALIBRATED_THRESHOLDS[backend]
+        return [score >= cutoff for score in ratio_many(query, choices, backend, cutoff)]
+
+    # InDel similarity >= difflib ratio: anything it rejects difflib would too
+    scores = ratio_many(query, choices, backend, threshold)
+    return [
+        score >= threshold and SequenceMatcher(None, query, choice).ratio() >= threshold
+        for score, choice in zip(scores, choices)
+    ]
+
+
+@dataclass
+class Calibration:
+    """How well a backend threshold reproduces difflib's decisions."""
+    backend: str
+    threshold: float
+    pairs: int
+    false_accepts: int  # backend says similar, difflib doesn't
+    false_rejects: int  # difflib says similar, backend doesn't
+
+    @property
+    def agreement(self) -> float:
+        return 1 - (self.false_accepts + self.false_rejects) / self.pairs if self.pairs else 1.0
+
+
+def calibrate(pairs: list[tuple[str, str]], backend: Optional[str] = None,
+              reference_threshold: float = REFERENCE_THRESHOLD) -> Calibration:
+    """
+    Find the backend threshold that disagrees least with difflib at
+    `reference_threshold` on the given string pairs. Ties go to the higher
+    threshold, so calibration errs toward fewer merges.
+    """
+    backend = _check_backend(backend)
+    labeled = sorted(
+        (round(ratio(a, b, backend), 4), SequenceMatcher(None, a, b).ratio() >= reference_threshold)
+        for a, b in pairs
+    )
+
+    # Sweep thresholds upward: everything below the threshold is rejected
+    positives = sum(1 for _, similar in labeled if similar)
+    best = Calibration(backend, 0.0, len(labeled), len(labeled) - positives, 0)
+    false_rejects = 0
+    false_accepts = len(labeled) - positives
+    i = 0
+    while i < len(labeled):
+        score = labeled[i][0]
+        while i < len(labeled) and labeled[i][0] == score:
+            if labeled[i][1]:
+                false_rejects += 1
+            else:
+                false_accepts -= 1
+            i += 1
+        # Threshold just above `score`: the next distinct score (or 1.0)
+        threshold = labeled[i][0] if i < len(labeled) else 1.0
+        if false_accepts + false_rejects <= best.false_accepts + best.false_rejects:
+            best = Calibration(backend, threshold, len(labeled), false_accepts, false_rejects)
+
+    return best
+
+
+if __name__ == "__main__":
+    import json
+    import random
+    from pathlib import Path
+
+    from utils.deduplication import _normalize_name
+    from utils.ngram_index import candidate_pairs
+
+    data_path = Path(__file__).parent.parent.parent / "public" / "data" / "conferences.json"
+    with open(data_path) as f:
+        names = sorted({
+            _normalize_name(c["name"])
+            for month in json.load(f)["months"].values() for c in month
+        })
+
+    # Near pairs the dedup actually compares, plus random ones
+    pairs = [(names[i], names[j]) for i, j in candidate_pairs(names, min_dice=0.5)]
+    rng = random.Random(0)
+    pairs += [tuple(rng.sample(names, 2)) for _ in range(len(pairs))]
+
+    print(f"{len(pairs)} name pairs from {data_path.name}")
+    for backend in ("difflib", "rapidfuzz", "levenshtein"):
+        try:
+            result = calibrate(pairs, backend)
+        except ImportError as e:
+            print(f"  {backend:<12} skipped ({e})")
+            continue
+        print(
+            f"  {backend:<12} threshold={result.threshold:.4f}  agreement={result.agreement:.4f}  "
+            f"false accepts={result.false_accepts}  false rejects={result.false_rejects}"
+        )
@@ -0,0 +1,36 @@
+"""
+State File Module
+
+Versioned JSON files for the state the aggregator keeps between runs
+(crawl frontier, dedup index, classification cache). Every file is one
+object with a "version" field; a file that is missing, unreadable or of
+another version loads as empty, so changing a layout only needs a version
+bump. Files are replaced atomically, so an interrupted run never leaves
+half a file behind.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+def load_state(path: Path, version: int) -> dict:
+    """The object stored at path, or {} if there is no usable one."""
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get("version") != version:
+        return {}
+    return state
+
+
+def save_state(path: Path, version: int, state: dict):
+    """Write {"version": version, **state} to path through a temporary file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(json.dumps({"version": version, **state}, separators=(",", ":")))
+    os.replace(tmp_path, path)
@@ -0,0 +1,107 @@
+"""
+Tag Extractor Module
+
+Finds technology tags in conference text with one pass over it. Every
+tag (or alias of a tag) is compiled once into a single regex alternation,
+instead of building and running one regex per tag for every record.
+
+Two matching modes, matching the two tables that use this:
+
+- word_boundary=True: a keyword must be a whole word, like
+  re.search(rf"\\b{re.escape(keyword)}\\b", text).
+- word_boundary=False: plain substring matching, like `keyword in text`,
+  done with utils.keyword_automaton.
+
+Either way tags come back in table order, not text order.
+"""
+
+import re
+from typing import Optional, Union
+
+from utils.keyword_automaton import KeywordAutomaton, join_texts
+
+
+class TagExtractor:
+    """
+    Args:
+        tags: Tag names, or {tag: [keywords that mean it]}
+        word_boundary: Whole-word matching instead of substrings
+        limit: Return at most this many tags
+    """
+
+    def __init__(self, tags: Union[list[str], dict[str, list[str]]], word_boundary: bool = True,
+                 limit: Optional[int] = None):
+        if not isinstance(tags, dict):
+            tags = {tag: [tag] for tag in tags}
+        self.tags = list(tags)
+        self.limit = limit
+        self.word_boundary = word_boundary
+
+        if not word_boundary:
+            self._automaton = KeywordAutomaton(tags)
+            self._tag_index = {tag: i for i, tag in enumerate(self.tags)}
+            return
+
+        # keyword -> positions of the tags it stands for
+        self._tag_ids: dict[str, list[int]] = {}
+        for tag_id, keywords in enumerate(tags.values()):
+            for keyword in keywords:
+                self._tag_ids.setdefault(keyword, []).append(tag_id)
+
+        # Longest first, so at each position the alternation picks the
+        # longest keyword that matches there. The lookahead lets matches
+        # overlap, as separate searches would.
+        keywords = sorted(self._tag_ids, key=len, reverse=True)
+        self._pattern = re.compile(
+            r"(?=\b(" + "|".join(map(re.escape, keywords)) + r")\b)"
+        ) if keywords else None
+
+        # Shorter keywords that also match wherever a keyword does: its
+        # prefixes that end on a word boundary inside it
+        boundary = re.compile(r"\b")
+        self._also: dict[str, list[str]] = {}
+        for keyword in keywords:
+            ends = {m.start() for m in boundary.finditer(keyword)}
+            self._also[keyword] = [
+                other for other in self._tag_ids
+                if other != keyword and keyword.startswith(other) and len(other) in ends
+            ]
+
+    def extract(self, text: str) -> list[str]:
+        """Tags found in `text`, in table order, at most `limit` of them."""
+        return self.extract_many([text])[0]
+
+    def extract_many(self, texts: list[str]) -> list[list[str]]:
+        """extract() for every text, scanning the batch as one string."""
+        if not self.word_boundary:
+            found: list[set[int]] = [set() for _ in texts]
+            docs, keyword_ids = self._automaton.incidence(texts)
+            for doc, keyword_id in zip(docs, keyword_ids):
+                found[doc].update(self._tag_index[tag] for tag in self._automaton.listings[keyword_id])
+            return [self._tag_list(tag_ids) for tag_ids in found]
+
+        keywords: list[set[str]] = [set() for _ in texts]
+        if self._pattern and texts:
+            # Matches come in text order; the separator is not a word
+            # character, so \b behaves as at the ends of a single text
+            corpus = join_texts(texts)
+            doc, next_start = 0, len(texts[0]) + 1
+            for match in self._pattern.finditer(corpus):
+                while match.start() >= next_start:
+                    doc += 1
+                    next_start += len(texts[doc]) + 1
+                keywords[doc].add(match.group(1))
+
+        result = []
+        for found_keywords in keywords:
+            tag_ids = set()
+            for keyword in found_keywords:
+                tag_ids.update(self._tag_ids[keyword])
+                for other in self._also[keyword]:
+                    tag_ids.update(self._tag_ids[other])
+            result.append(self._tag_list(tag_ids))
+        return result
+
+    def _tag_list(self, tag_ids: set[int]) -> list[str]:
+        found = [self.tags[i] for i in sorted(tag_ids)]
+        return found[:self.limit] if self.limit is not None else found
@@ -0,0 +1,77 @@
+"""
+Text Normalization Module
+
+One place that turns conference names into comparable text, shared by
+deduplication, series keys and ID generation:
+
+    "DevCon #26 : Sécurité"  ->  fold()            "devcon #26 : securite"
+                             ->  normalize_name()  "devcon 26 securite"
+                             ->  slugify()         "devcon-26-securite"
+
+Folding applies Unicode compatibility decomposition (NFKD), drops the
+combining marks it leaves behind and lowercases, so accented and plain
+spellings of a name agree instead of losing their accented letters.
+Results are memoized, so each distinct name is normalized once per run.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
+
+# Bump when normalize_name() changes, so anything stored from it is rebuilt
+NORMALIZE_VERSION = 1
+
+# Letters NFKD leaves alone that still have a usual ASCII spelling
+LETTER_FOLDS = {
+    "ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "ł": "l", "đ": "d",
+    "ð": "d", "þ": "th", "ı": "i", "ŀ": "l",
+}
+
+
+class _NameTable(dict):
+    """
+    str.translate() table for folded text: letters and digits are kept,
+    whitespace becomes a space and everything else is deleted. Entries are
+    computed the first time a character is seen.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        if char.isalnum():
+            value = codepoint
+        elif char.isspace():
+            value = " "
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_FOLD_TABLE = str.maketrans(LETTER_FOLDS)
+_NAME_TABLE = _NameTable()
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=65536)
+def fold(text: Optional[str]) -> str:
+    """Lowercase text with accents and compatibility forms folded away."""
+    if not text:
+        return ""
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return text.translate(_FOLD_TABLE)
+
+
+@lru_cache(maxsize=65536)
+def normalize_name(name: Optional[str]) -> str:
+    """Folded name with punctuation removed and whitespace collapsed."""
+    return " ".join(fold(name).translate(_NAME_TABLE).split())
+
+
+def slugify(text: Optional[str]) -> str:
+    """Folded text as lowercase ASCII words joined by "-"."""
+    return _SLUG_SEPARATORS.sub("-", fold(text)).strip("-")
@@ -0,0 +1,41 @@
+"""
+Union-Find Module
+
+Disjoint-set forest with path compression and union by rank, used to turn
+pairwise duplicate matches into clusters in near-linear time.
+"""
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0..n-1."""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+
+    def find(self, x: int) -> int:
+        """Root of the set containing x (compresses the path on the way)."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> int:
+        """Join the sets containing a and b; returns the new root."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return root_a
+
+    def groups(self) -> list[list[int]]:
+        """All sets as sorted member lists, ordered by their smallest member."""
+        members: dict[int, list[int]] = {}
+        for x in range(len(self.parent)):
+            members.setdefault(self.find(x), []).append(x)
+        return list(members.values())
@@ -0,0 +1,80 @@
+"""
+URL Canonicalization Module
+
+Reduces the many spellings of a conference website to one key, so records
+from different sources that point at the same page can be matched with a
+dict lookup instead of fuzzy name comparison.
+
+    https://www.Example.com:443/2026/?utm_source=x#cfp  ->  example.com/2026
+"""
+
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+# Bump when canonical_url() changes, so stored canonical URLs are rebuilt
+CANONICAL_VERSION = 1
+
+# Query parameters that only track where a visitor came from
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "ref", "ref_src",
+}
+
+DEFAULT_PORTS = {"80", "443"}
+
+INDEX_PAGES = ("index.html", "index.htm", "index.php")
+
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: Optional[str]) -> str:
+    """
+    Canonical form of a URL: host and path, lowercased, without scheme,
+    "www.", default port, index page, trailing slash, fragment or tracking
+    parameters. Remaining query parameters are kept, sorted.
+
+    Returns "" for empty or unparseable URLs.
+    """
+    if not url:
+        return ""
+    url = url.strip().lower()
+    if "://" not in url:
+        url = "http://" + url
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+        port = parts.port
+    except ValueError:
+        return ""
+    if not host:
+        return ""
+
+    if host.startswith("www."):
+        host = host[4:]
+    if port and str(port) not in DEFAULT_PORTS:
+        host = f"{host}:{port}"
+
+    path = parts.path
+    for page in INDEX_PAGES:
+        if path.endswith("/" + page):
+            path = path[:-len(page)]
+            break
+    path = path.rstrip("/")
+
+    params = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in TRACKING_PARAMS
+    )
+    query = "?" + urlencode(params) if params else ""
+
+    return host + path + query
+
+
+def build_url_index(urls: list[str]) -> dict[str, list[int]]:
+    """Map each non-empty canonical URL to the positions it appears at."""
+    index: dict[str, list[int]] = {}
+    for i, url in enumerate(urls):
+        if url:
+            index.setdefault(url, []).append(i)
+    return index
@@ -62,6 +62,7 @@ export interface Conference {
   // Source tracking
   source: string;
   sources?: string[]; // When merged from multiple sources
+  provenance?: Record<string, string>; // Merged field -> source it came from
 }
 
 // Month-grouped conference data structure (matches JSON output)